@@ -6,6 +6,7 @@ and base model class for all database models.
 """
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -22,13 +23,52 @@ settings = get_settings()
 # Create SQLAlchemy engine
 # For SQLite: connect_args with check_same_thread=False allows multiple threads
 # For production PostgreSQL, remove connect_args
-if settings.database_url.startswith("sqlite"):
-    engine = create_engine(
-        settings.database_url,
-        connect_args={"check_same_thread": False},
-        echo=False  # Disable SQL query logging (too verbose)
+def create_app_engine(database_url: str):
+    """
+    Build the application engine with the pooling setup for the URL's backend.
+
+    Factored out of module scope so engine construction is testable against
+    URLs other than the configured one.
+    """
+    if database_url.startswith("sqlite"):
+        engine_kwargs = {
+            "connect_args": {"check_same_thread": False},
+            "echo": False,  # Disable SQL query logging (too verbose)
+            "query_cache_size": 1200,  # Reuse compiled SQL for the hot service queries
+            # Rows-per-statement cap for executemany INSERTs (the seeders use
+            # db.execute(insert(Model), rows)). Pinned to SQLAlchemy's default
+            # so the knob is visible here if a future bulk load needs tuning.
+            "insertmanyvalues_page_size": 1000,
+        }
+        # Explicit pool bound: enough for the request threadpool plus the
+        # WebSocket flush without letting a refresh storm open a connection
+        # (and its pragma setup) per client. pre_ping/recycle are pointless
+        # against a local file and are left off. In-memory URLs are excluded:
+        # they select SingletonThreadPool, which rejects QueuePool sizing
+        # arguments at create_engine time.
+        if make_url(database_url).database not in (None, "", ":memory:"):
+            engine_kwargs.update(pool_size=10, max_overflow=5)
+        return create_engine(database_url, **engine_kwargs)
+
+    return create_engine(
+        database_url,
+        echo=False,  # Disable SQL query logging (too verbose)
+        pool_pre_ping=True,  # Verify connections before using them
+        query_cache_size=1200,  # Reuse compiled SQL for the hot service queries
+        # Same explicit bound as the SQLite branch, plus recycling so a
+        # server-side idle timeout (MySQL wait_timeout) never hands out a
+        # dead connection
+        pool_size=10,
+        max_overflow=5,
+        pool_recycle=300,
+        # Same executemany batching cap as the SQLite branch
+        insertmanyvalues_page_size=1000,
     )
 
+
+engine = create_app_engine(settings.database_url)
+
+if settings.database_url.startswith("sqlite"):
     # Enable foreign key constraints for SQLite
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
@@ -41,12 +81,6 @@ if settings.database_url.startswith("sqlite"):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
-else:
-    engine = create_engine(
-        settings.database_url,
-        echo=False,  # Disable SQL query logging (too verbose)
-        pool_pre_ping=True  # Verify connections before using them
-    )
 
 # =============================================================================
 # Session Factory
@@ -119,7 +153,7 @@ def init_db() -> None:
         Base.metadata.create_all(bind=engine)
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {str(e)}")
+        logger.error("Failed to initialize database: %s", str(e))
         raise
 
 def drop_all_tables() -> None:
@@ -133,7 +167,7 @@ def drop_all_tables() -> None:
         Base.metadata.drop_all(bind=engine)
         logger.warning("All tables dropped successfully")
     except Exception as e:
-        logger.error(f"Failed to drop tables: {str(e)}")
+        logger.error("Failed to drop tables: %s", str(e))
         raise
 
 def reset_db() -> None:
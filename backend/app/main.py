@@ -10,6 +10,7 @@ from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from pathlib import Path
+import os
 from app.config import get_settings
 from app.database import init_db, get_db, SessionLocal
 from app.seed import auto_seed_if_empty, ensure_schema
@@ -23,7 +24,7 @@ from app.routes import (
     admin_router,
     team_router
 )
-from app.websocket.leaderboard import leaderboard_websocket_endpoint
+from app.websocket.leaderboard import capture_event_loop, leaderboard_websocket_endpoint
 from app.tasks import start_scheduler, shutdown_scheduler
 from app.utils.logger import logger
 from app.utils.exceptions import EVGException, format_exception_response
@@ -50,9 +51,9 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("=" * 80)
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Debug mode: {settings.debug}")
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    logger.info("Environment: %s", settings.environment)
+    logger.info("Debug mode: %s", settings.debug)
     logger.info("=" * 80)
 
     # Initialize database
@@ -71,6 +72,9 @@ async def lifespan(app: FastAPI):
     start_scheduler()
     logger.info("Pack scheduler started")
 
+    # Let sync route handlers schedule debounced WebSocket broadcasts
+    capture_event_loop()
+
     yield
 
     # Shutdown
@@ -108,6 +112,27 @@ app.add_middleware(
 )
 
 
+# =============================================================================
+# Dev Query-Count Middleware
+# =============================================================================
+
+# Opt-in N+1 visibility: with EVG_DEBUG_QUERIES=1 every response carries an
+# X-Query-Count header so lazy-load regressions show up in the browser's
+# network tab. Off by default — the count is engine-wide and approximate
+# under concurrency, and it adds a listener per request.
+if os.environ.get("EVG_DEBUG_QUERIES") == "1":
+    from app.database import engine
+    from app.utils.query_counter import count_queries
+
+    @app.middleware("http")
+    async def query_count_header(request: Request, call_next):
+        """Attach the number of SQL statements the request issued."""
+        with count_queries(engine) as counter:
+            response = await call_next(request)
+        response.headers["X-Query-Count"] = str(counter["count"])
+        return response
+
+
 # =============================================================================
 # Exception Handlers
 # =============================================================================
@@ -186,7 +211,7 @@ FRONTEND_DIST = Path(__file__).parent.parent.parent / "frontend" / "dist"
 
 # Mount static files if dist directory exists (production mode)
 if FRONTEND_DIST.exists():
-    logger.info(f"Serving frontend static files from {FRONTEND_DIST}")
+    logger.info("Serving frontend static files from %s", FRONTEND_DIST)
 
     # Serve static assets (JS, CSS, images, etc.)
     app.mount("/assets", StaticFiles(directory=FRONTEND_DIST / "assets"), name="static-assets")
@@ -208,7 +233,7 @@ if FRONTEND_DIST.exists():
             return FileResponse(vite_path)
         return {"success": False, "error": "Vite SVG not found"}
 else:
-    logger.warning(f"Frontend dist directory not found at {FRONTEND_DIST}")
+    logger.warning("Frontend dist directory not found at %s", FRONTEND_DIST)
     logger.warning("Frontend will not be served. Run 'npm run build' in frontend directory.")
 
 
@@ -330,5 +355,11 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        # Matches the Dockerfile: small broadcast frames are not worth
+        # per-connection re-compression, and keepalive is protocol-level
+        # PING/PONG rather than app-level text messages
+        ws_per_message_deflate=False,
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
     )
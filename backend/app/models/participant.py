@@ -5,7 +5,7 @@ Represents a participant in the bachelor party event.
 """
 
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -42,6 +42,16 @@ class Participant(Base):
         comment="Participant's full name (used for login)"
     )
 
+    name_lower = Column(
+        String(100),
+        nullable=True,
+        unique=True,
+        index=True,
+        comment="Lowercased copy of name, kept in sync automatically. "
+                "Allows indexed exact-match login lookups instead of ILIKE scans, "
+                "and its unique index is the authoritative duplicate-name gate."
+    )
+
     avatar_url = Column(
         String(500),
         nullable=True,
@@ -97,6 +107,17 @@ class Participant(Base):
         comment="Multiplier for next challenge points (from pack reward), resets to 1 after use"
     )
 
+    # Denormalized counter maintained by open_pack in the same transaction as
+    # the PackOpening INSERT — stats displays read it directly instead of
+    # COUNT(*)-ing the history table per participant
+    pack_opening_count = Column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Total number of packs this participant has opened"
+    )
+
     # Pack Inventory (Phase 2 feature, prepared for future use)
     current_packs = Column(
         JSON,
@@ -148,6 +169,12 @@ class Participant(Base):
     # Methods
     # ==========================================================================
 
+    @validates("name")
+    def _sync_name_lower(self, key: str, value: str) -> str:
+        """Keep name_lower in sync whenever name is set or updated."""
+        self.name_lower = value.lower() if value is not None else None
+        return value
+
     def add_points(self, amount: int) -> None:
         """
         Add points to the participant's total AND pack credits.
@@ -4,7 +4,7 @@ Points Transaction database model for EVG Ultimate Team.
 Tracks all point changes for participants, providing a complete audit trail.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -30,6 +30,17 @@ class PointsTransaction(Base):
 
     __tablename__ = "points_transactions"
 
+    # Composite index matching the hot scans: per-participant history pages
+    # and the "points today" sums both filter on participant_id and
+    # sort/range on created_at, so this turns them into pure index walks
+    __table_args__ = (
+        Index(
+            "ix_points_tx_participant_created",
+            "participant_id",
+            "created_at",
+        ),
+    )
+
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
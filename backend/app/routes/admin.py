@@ -87,7 +87,7 @@ def reset_database(
             new_db.close()
 
     except Exception as e:
-        logger.error(f"Database reset failed: {str(e)}")
+        logger.error("Database reset failed: %s", str(e))
         raise HTTPException(
             status_code=500,
             detail=f"Failed to reset database: {str(e)}"
@@ -48,7 +48,7 @@ def participant_login(
             message=f"Welcome, {token.username}!"
         )
     except EVGException as e:
-        logger.error(f"Login failed: {e.message}")
+        logger.error("Login failed: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -88,5 +88,5 @@ def admin_login(
             message=f"Admin login successful. Welcome, {token.username}!"
         )
     except EVGException as e:
-        logger.error(f"Admin login failed: {e.message}")
+        logger.error("Admin login failed: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
@@ -4,7 +4,10 @@ Challenge routes for EVG Ultimate Team API.
 Handles challenge CRUD operations and validation.
 """
 
+from collections import defaultdict
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
@@ -18,9 +21,11 @@ from app.schemas.challenge import (
 from app.schemas.common import APIResponse, SuccessResponse
 from app.services import challenge_service, points_service
 from app.utils.dependencies import get_current_user_payload, get_admin_id
+from app.websocket.leaderboard import schedule_leaderboard_broadcast
 from app.utils.exceptions import EVGException, format_exception_response
 from app.utils.logger import logger
 from app.models import Challenge, ChallengeStatus
+from app.models.challenge import challenge_assignments, challenge_completions
 
 router = APIRouter(prefix="/challenges", tags=["Challenges"])
 
@@ -51,6 +56,61 @@ def _serialize_challenge(challenge) -> dict:
     }
 
 
+def _serialize_challenges(db: Session, challenges) -> list[dict]:
+    """
+    Serialize a batch of challenges with constant query count.
+
+    The dynamic relationships emit one SELECT per challenge when touched, so
+    listing N challenges cost 2N association queries. This fetches all
+    assignment and completion rows with two IN queries instead.
+
+    Args:
+        db: Database session
+        challenges: Iterable of Challenge ORM instances
+
+    Returns:
+        List of serialized challenge dictionaries
+    """
+    challenge_ids = [c.id for c in challenges]
+
+    assigned_map = defaultdict(list)
+    completed_map = defaultdict(list)
+    if challenge_ids:
+        for challenge_id, participant_id in db.execute(
+            select(
+                challenge_assignments.c.challenge_id,
+                challenge_assignments.c.participant_id
+            ).where(challenge_assignments.c.challenge_id.in_(challenge_ids))
+        ):
+            assigned_map[challenge_id].append(participant_id)
+
+        for challenge_id, participant_id in db.execute(
+            select(
+                challenge_completions.c.challenge_id,
+                challenge_completions.c.participant_id
+            ).where(challenge_completions.c.challenge_id.in_(challenge_ids))
+        ):
+            completed_map[challenge_id].append(participant_id)
+
+    return [
+        {
+            "id": challenge.id,
+            "title": challenge.title,
+            "description": challenge.description,
+            "type": challenge.type,
+            "points": challenge.points,
+            "status": challenge.status,
+            "assigned_to": assigned_map.get(challenge.id, []),
+            "completed_by": completed_map.get(challenge.id, []),
+            "validated_by": challenge.validated_by,
+            "created_at": challenge.created_at,
+            "completed_at": challenge.completed_at,
+            "updated_at": challenge.updated_at
+        }
+        for challenge in challenges
+    ]
+
+
 @router.get("", response_model=APIResponse[List[ChallengeResponse]])
 def list_challenges(
     skip: int = 0,
@@ -69,7 +129,7 @@ def list_challenges(
     """
     try:
         challenges = challenge_service.get_all_challenges(db, skip, limit)
-        challenge_responses = [_serialize_challenge(c) for c in challenges]
+        challenge_responses = _serialize_challenges(db, challenges)
 
         return APIResponse(
             success=True,
@@ -77,7 +137,7 @@ def list_challenges(
             message=f"Retrieved {len(challenges)} challenges"
         )
     except EVGException as e:
-        logger.error(f"Failed to list challenges: {e.message}")
+        logger.error("Failed to list challenges: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -103,7 +163,7 @@ def get_challenge(
             message=f"Challenge retrieved: {challenge.title}"
         )
     except EVGException as e:
-        logger.error(f"Failed to get challenge {challenge_id}: {e.message}")
+        logger.error("Failed to get challenge %s: %s", challenge_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -136,7 +196,7 @@ def create_challenge(
             message=f"Challenge created: {challenge.title}"
         )
     except EVGException as e:
-        logger.error(f"Failed to create challenge: {e.message}")
+        logger.error("Failed to create challenge: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -169,7 +229,7 @@ def update_challenge(
             message=f"Challenge updated: {challenge.title}"
         )
     except EVGException as e:
-        logger.error(f"Failed to update challenge {challenge_id}: {e.message}")
+        logger.error("Failed to update challenge %s: %s", challenge_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -197,7 +257,7 @@ def delete_challenge(
             message=f"Challenge {challenge_id} deleted successfully"
         )
     except EVGException as e:
-        logger.error(f"Failed to delete challenge {challenge_id}: {e.message}")
+        logger.error("Failed to delete challenge %s: %s", challenge_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -234,7 +294,7 @@ def attempt_challenge(
             message=f"Challenge marked as active: {challenge.title}"
         )
     except EVGException as e:
-        logger.error(f"Failed to attempt challenge {challenge_id}: {e.message}")
+        logger.error("Failed to attempt challenge %s: %s", challenge_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -281,6 +341,8 @@ def validate_challenge(
                     challenge_id,
                     admin_id
                 )
+            # One debounced broadcast for the whole batch of awards
+            schedule_leaderboard_broadcast()
 
         return APIResponse(
             success=True,
@@ -288,30 +350,36 @@ def validate_challenge(
             message=f"Challenge validated as {validation_data.status.value}: {challenge.title}"
         )
     except EVGException as e:
-        logger.error(f"Failed to validate challenge {challenge_id}: {e.message}")
+        logger.error("Failed to validate challenge %s: %s", challenge_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
 @router.get("/participant/{participant_id}", response_model=APIResponse[dict])
 def get_participant_challenges(
     participant_id: int,
+    skip: int = 0,
+    limit: int = 100,
     db: Session = Depends(get_db)
 ):
     """
-    Get all challenges for a specific participant.
+    Get challenges for a specific participant.
 
     **Path Parameters:**
     - `participant_id`: Participant ID
 
+    **Query Parameters:**
+    - `skip`: Number of records to skip (pagination)
+    - `limit`: Maximum number of records to return
+
     **Returns:**
     - Dictionary with 'assigned' and 'completed' challenge lists
     """
     try:
-        challenges = challenge_service.get_participant_challenges(db, participant_id)
+        challenges = challenge_service.get_participant_challenges(db, participant_id, skip, limit)
         # Serialize the challenge lists
         serialized_challenges = {
-            "assigned": [_serialize_challenge(c) for c in challenges["assigned"]],
-            "completed": [_serialize_challenge(c) for c in challenges["completed"]]
+            "assigned": _serialize_challenges(db, challenges["assigned"]),
+            "completed": _serialize_challenges(db, challenges["completed"])
         }
         return APIResponse(
             success=True,
@@ -319,5 +387,5 @@ def get_participant_challenges(
             message=f"Retrieved challenges for participant {participant_id}"
         )
     except EVGException as e:
-        logger.error(f"Failed to get challenges for participant {participant_id}: {e.message}")
+        logger.error("Failed to get challenges for participant %s: %s", participant_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
@@ -39,7 +39,7 @@ def get_leaderboard(
             message=f"Leaderboard with {len(leaderboard)} participants"
         )
     except EVGException as e:
-        logger.error(f"Failed to get leaderboard: {e.message}")
+        logger.error("Failed to get leaderboard: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -59,7 +59,7 @@ def get_top_3(db: Session = Depends(get_db)):
             message="Top 3 participants"
         )
     except EVGException as e:
-        logger.error(f"Failed to get top 3: {e.message}")
+        logger.error("Failed to get top 3: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -81,7 +81,7 @@ def get_daily_leader(db: Session = Depends(get_db)):
             message=f"Today's leader: {daily_leader.name if daily_leader else 'No leader yet'}"
         )
     except EVGException as e:
-        logger.error(f"Failed to get daily leader: {e.message}")
+        logger.error("Failed to get daily leader: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -107,7 +107,7 @@ def get_participant_rank(
             message=f"Participant is ranked #{rank}"
         )
     except EVGException as e:
-        logger.error(f"Failed to get participant rank: {e.message}")
+        logger.error("Failed to get participant rank: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -127,5 +127,5 @@ def get_leaderboard_stats(db: Session = Depends(get_db)):
             message="Leaderboard statistics"
         )
     except EVGException as e:
-        logger.error(f"Failed to get leaderboard stats: {e.message}")
+        logger.error("Failed to get leaderboard stats: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
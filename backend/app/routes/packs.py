@@ -52,10 +52,10 @@ def get_inventory(
             message="Pack inventory retrieved successfully"
         )
     except ValueError as e:
-        logger.error(f"Failed to get pack inventory for participant {current_user.id}: {str(e)}")
+        logger.error("Failed to get pack inventory for participant %s: %s", current_user.id, str(e))
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error getting pack inventory: {str(e)}")
+        logger.error("Unexpected error getting pack inventory: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve pack inventory")
 
 
@@ -79,7 +79,7 @@ def get_pack_costs():
             message="Pack costs retrieved successfully"
         )
     except Exception as e:
-        logger.error(f"Unexpected error getting pack costs: {str(e)}")
+        logger.error("Unexpected error getting pack costs: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve pack costs")
 
 
@@ -110,7 +110,7 @@ def purchase_pack(
         pack_service.purchase_pack(db, participant_id, request.tier)
         inventory = pack_service.get_pack_inventory(db, participant_id)
 
-        logger.info(f"Pack purchased: participant={participant_id}, tier={request.tier}")
+        logger.info("Pack purchased: participant=%s, tier=%s", participant_id, request.tier)
 
         return APIResponse(
             success=True,
@@ -118,10 +118,10 @@ def purchase_pack(
             message=f"Purchased {request.tier} pack successfully!"
         )
     except ValueError as e:
-        logger.warning(f"Pack purchase failed for participant {current_user.id}: {str(e)}")
+        logger.warning("Pack purchase failed for participant %s: %s", current_user.id, str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error purchasing pack: {str(e)}")
+        logger.error("Unexpected error purchasing pack: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to purchase pack")
 
 
@@ -153,7 +153,7 @@ def open_pack(
         participant_id = current_user.id
         result = pack_service.open_pack(db, participant_id, request.tier)
 
-        logger.info(f"Pack opened: participant={participant_id}, tier={request.tier}, reward={result.reward.name}")
+        logger.info("Pack opened: participant=%s, tier=%s, reward=%s", participant_id, request.tier, result.reward.name)
 
         return APIResponse(
             success=True,
@@ -161,10 +161,10 @@ def open_pack(
             message=f"Opened {request.tier} pack successfully!"
         )
     except ValueError as e:
-        logger.warning(f"Pack opening failed for participant {current_user.id}: {str(e)}")
+        logger.warning("Pack opening failed for participant %s: %s", current_user.id, str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error opening pack: {str(e)}")
+        logger.error("Unexpected error opening pack: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to open pack")
 
 
@@ -196,7 +196,7 @@ def get_history(
             message=f"Retrieved {len(history)} pack opening(s)"
         )
     except Exception as e:
-        logger.error(f"Unexpected error getting pack history: {str(e)}")
+        logger.error("Unexpected error getting pack history: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve pack history")
 
 
@@ -320,5 +320,5 @@ def get_rewards_by_tier(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error getting rewards for tier {tier}: {str(e)}")
+        logger.error("Unexpected error getting rewards for tier %s: %s", tier, str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve rewards")
@@ -42,7 +42,7 @@ def list_participants(
             message=f"Retrieved {len(participants)} participants"
         )
     except EVGException as e:
-        logger.error(f"Failed to list participants: {e.message}")
+        logger.error("Failed to list participants: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -68,7 +68,7 @@ def get_participant(
             message=f"Participant retrieved: {participant.name}"
         )
     except EVGException as e:
-        logger.error(f"Failed to get participant {participant_id}: {e.message}")
+        logger.error("Failed to get participant %s: %s", participant_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -118,7 +118,7 @@ def create_participant(
             message=f"Participant created: {participant.name}"
         )
     except EVGException as e:
-        logger.error(f"Failed to create participant: {e.message}")
+        logger.error("Failed to create participant: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -151,7 +151,7 @@ def update_participant(
             message=f"Participant updated: {participant.name}"
         )
     except EVGException as e:
-        logger.error(f"Failed to update participant {participant_id}: {e.message}")
+        logger.error("Failed to update participant %s: %s", participant_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -182,5 +182,5 @@ def delete_participant(
             message=f"Participant {participant_id} deleted successfully"
         )
     except EVGException as e:
-        logger.error(f"Failed to delete participant {participant_id}: {e.message}")
+        logger.error("Failed to delete participant %s: %s", participant_id, e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
@@ -17,6 +17,7 @@ from app.schemas.points import (
 from app.schemas.common import APIResponse
 from app.services import points_service, participant_service
 from app.utils.dependencies import require_admin, get_admin_id
+from app.websocket.leaderboard import schedule_leaderboard_broadcast
 from app.utils.exceptions import EVGException, format_exception_response
 from app.utils.logger import logger
 
@@ -45,13 +46,14 @@ def add_points(
     """
     try:
         transaction = points_service.add_points_to_participant(db, points_data)
+        schedule_leaderboard_broadcast()
         return APIResponse(
             success=True,
             data=transaction,
             message=f"Added {points_data.amount} points"
         )
     except EVGException as e:
-        logger.error(f"Failed to add points: {e.message}")
+        logger.error("Failed to add points: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -77,13 +79,14 @@ def subtract_points(
     """
     try:
         transaction = points_service.subtract_points_from_participant(db, points_data)
+        schedule_leaderboard_broadcast()
         return APIResponse(
             success=True,
             data=transaction,
             message=f"Subtracted {points_data.amount} points"
         )
     except EVGException as e:
-        logger.error(f"Failed to subtract points: {e.message}")
+        logger.error("Failed to subtract points: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -126,7 +129,7 @@ def get_points_history(
             message=f"Retrieved {len(transactions)} transactions"
         )
     except EVGException as e:
-        logger.error(f"Failed to get points history: {e.message}")
+        logger.error("Failed to get points history: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
 
 
@@ -154,5 +157,5 @@ def get_recent_transactions(
             message=f"Retrieved {len(transactions)} recent transactions"
         )
     except EVGException as e:
-        logger.error(f"Failed to get recent transactions: {e.message}")
+        logger.error("Failed to get recent transactions: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=format_exception_response(e))
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/team", tags=["Team"])
 
 @router.get("/composition", response_model=APIResponse[TeamCompositionResponse])
 def get_team_composition(
-    _payload: dict = Depends(get_current_user_payload),
+    _payload = Depends(get_current_user_payload),
     db: Session = Depends(get_db),
 ):
     """
@@ -36,14 +36,14 @@ def get_team_composition(
             message="Team composition retrieved successfully",
         )
     except Exception as e:
-        logger.error(f"Failed to get team composition: {str(e)}")
+        logger.error("Failed to get team composition: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve team composition")
 
 
 @router.put("/composition", response_model=APIResponse[TeamCompositionResponse])
 def update_team_composition(
     request: TeamCompositionUpdate,
-    payload: dict = Depends(require_groom_or_admin),
+    payload = Depends(require_groom_or_admin),
     db: Session = Depends(get_db),
 ):
     """
@@ -57,7 +57,7 @@ def update_team_composition(
     """
     try:
         composition = team_service.update_composition(
-            db, request, editor_id=payload.get("user_id")
+            db, request, editor_id=payload.user_id
         )
         return APIResponse(
             success=True,
@@ -65,8 +65,8 @@ def update_team_composition(
             message="Composition enregistrée !",
         )
     except ValueError as e:
-        logger.warning(f"Team composition update rejected: {str(e)}")
+        logger.warning("Team composition update rejected: %s", str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error updating team composition: {str(e)}")
+        logger.error("Unexpected error updating team composition: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to update team composition")
@@ -4,7 +4,7 @@ Pydantic schemas for authentication.
 Defines request and response schemas for authentication-related API endpoints.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 
 
@@ -26,6 +26,19 @@ class ParticipantLogin(BaseModel):
         description="Participant's name (case-insensitive)"
     )
 
+    @field_validator("username", mode="before")
+    @classmethod
+    def _normalize_username(cls, value):
+        """
+        Normalize once at validation: strip whitespace and lowercase.
+
+        The auth service can then match the indexed name_lower column directly
+        with no per-call casing work.
+        """
+        if isinstance(value, str):
+            return value.strip().lower()
+        return value
+
     class Config:
         """Pydantic configuration."""
         json_schema_extra = {
@@ -4,7 +4,9 @@ Auto-seed module for EVG Ultimate Team.
 Automatically seeds the database with initial data if empty.
 """
 
-from sqlalchemy import inspect, text
+from types import MappingProxyType
+
+from sqlalchemy import insert, inspect, text
 from sqlalchemy.orm import Session
 from app.models import Participant, Challenge, ChallengeType, ChallengeStatus, PackReward
 from app.utils.logger import logger
@@ -17,7 +19,9 @@ def ensure_schema(db: Session) -> None:
     ``create_all`` creates missing tables but never ALTERs existing ones, so
     columns added after the first deploy must be patched in here to avoid a full
     DB reset (and the chicken-and-egg problem where admin login needs a column
-    that doesn't exist yet). Currently handles: participants.is_admin.
+    that doesn't exist yet). Currently handles: participants.is_admin,
+    participants.points_multiplier, participants.name_lower,
+    participants.pack_opening_count.
 
     Supports SQLite and MySQL/MariaDB, which are the deployed backends used by
     this project.
@@ -53,6 +57,50 @@ def ensure_schema(db: Session) -> None:
         db.commit()
         logger.info("Migration complete: participants.points_multiplier")
 
+    if "name_lower" not in columns:
+        # Login matches on this column, so an existing DB without it would
+        # crash on the very first participant query at startup
+        logger.info("Migrating: adding participants.name_lower column")
+        db.execute(text(
+            "ALTER TABLE participants ADD COLUMN name_lower VARCHAR(100)"
+        ))
+        db.execute(text(
+            "UPDATE participants SET name_lower = lower(name)"
+        ))
+        # name is already unique, so the freshly backfilled values are too;
+        # plain CREATE works on both SQLite and MySQL inside this branch
+        # because the column (and thus the index) did not exist
+        db.execute(text(
+            "CREATE UNIQUE INDEX ix_participants_name_lower "
+            "ON participants (name_lower)"
+        ))
+        db.commit()
+        logger.info("Migration complete: participants.name_lower")
+
+    if "pack_opening_count" not in columns:
+        logger.info("Migrating: adding participants.pack_opening_count column")
+        db.execute(text(
+            "ALTER TABLE participants ADD COLUMN pack_opening_count INTEGER NOT NULL DEFAULT 0"
+        ))
+        # Backfill the denormalized counter from the history table so stats
+        # are correct from the first request, not just for future openings
+        if "pack_openings" in tables:
+            db.execute(text(
+                "UPDATE participants SET pack_opening_count = ("
+                "SELECT COUNT(*) FROM pack_openings "
+                "WHERE pack_openings.participant_id = participants.id)"
+            ))
+        db.commit()
+        logger.info("Migration complete: participants.pack_opening_count")
+
+
+# Shared empty pack-counts default, built once and treated as read-only.
+# Every seeded row references the same object; the JSON column type
+# serializes it at bind time, so no per-row dict literal is needed. Kept a
+# plain dict (not a MappingProxyType like PACK_REWARDS) because the stdlib
+# JSON encoder only accepts real dicts.
+_EMPTY_PACKS = {"bronze": 0, "silver": 0, "gold": 0, "ultimate": 0}
+
 
 def seed_participants(db: Session) -> None:
     """Seed the database with all 13 participants."""
@@ -72,19 +120,29 @@ def seed_participants(db: Session) -> None:
         {"name": "Adrien M.", "is_groom": False, "avatar_url": None},
     ]
 
-    for data in participants_data:
-        participant = Participant(
-            name=data["name"],
-            is_groom=data["is_groom"],
-            is_admin=data.get("is_admin", False),
-            avatar_url=data["avatar_url"],
-            total_points=0,
-            current_packs={"bronze": 0, "silver": 0, "gold": 0, "ultimate": 0}
-        )
-        db.add(participant)
+    # Single multi-row INSERT through the Core insert() construct — no
+    # per-row instance construction or unit-of-work tracking, and the
+    # executemany goes through SQLAlchemy's insertmanyvalues batching
+    db.execute(
+        insert(Participant),
+        [
+            {
+                "name": data["name"],
+                # Core inserts bypass the ORM @validates sync on name, so the
+                # login-lookup column must be filled in explicitly here
+                "name_lower": data["name"].lower(),
+                "is_groom": data["is_groom"],
+                "is_admin": data.get("is_admin", False),
+                "avatar_url": data["avatar_url"],
+                "total_points": 0,
+                "current_packs": _EMPTY_PACKS,
+            }
+            for data in participants_data
+        ],
+    )
 
     db.commit()
-    logger.info(f"✓ Created {len(participants_data)} participants")
+    logger.info("✓ Created %s participants", len(participants_data))
 
 
 def seed_challenges(db: Session) -> None:
@@ -225,18 +283,12 @@ def seed_challenges(db: Session) -> None:
         },
     ]
 
-    for data in challenges_data:
-        challenge = Challenge(
-            title=data["title"],
-            description=data["description"],
-            type=data["type"],
-            points=data["points"],
-            status=data["status"]
-        )
-        db.add(challenge)
+    # One executemany-batched INSERT; the enum members pass straight through
+    # to the Enum column type, so no per-row normalization is needed
+    db.execute(insert(Challenge), challenges_data)
 
     db.commit()
-    logger.info(f"✓ Created {len(challenges_data)} challenges")
+    logger.info("✓ Created %s challenges", len(challenges_data))
 
 
 # =============================================================================
@@ -285,22 +337,32 @@ PACK_REWARDS = [
     {"tier": "ultimate", "name": "Capitaine de soirée", "description": "Tu décides de la prochaine activité du groupe.", "type": "power", "rarity": "legendary"},
 ]
 
+# Freeze the catalogue: an immutable tuple of read-only views, safe to share
+# across threads and impossible for a seeding path to mutate by accident.
+PACK_REWARDS = tuple(MappingProxyType(entry) for entry in PACK_REWARDS)
+
 
 def seed_rewards(db: Session) -> None:
     """Seed the database with the fun, lightweight pack rewards (en français)."""
-    for data in PACK_REWARDS:
-        reward = PackReward(
-            tier=data["tier"],
-            reward_name=data["name"],
-            reward_description=data["description"],
-            reward_type=data["type"],
-            rarity=data["rarity"],
-            is_active=True
-        )
-        db.add(reward)
+    # One multi-row INSERT instead of a unit-of-work flush per reward; the
+    # catalogue rows need no relationship wiring
+    db.execute(
+        insert(PackReward),
+        [
+            {
+                "tier": data["tier"],
+                "reward_name": data["name"],
+                "reward_description": data["description"],
+                "reward_type": data["type"],
+                "rarity": data["rarity"],
+                "is_active": True,
+            }
+            for data in PACK_REWARDS
+        ],
+    )
 
     db.commit()
-    logger.info(f"✓ Created {len(PACK_REWARDS)} pack rewards")
+    logger.info("✓ Created %s pack rewards", len(PACK_REWARDS))
 
 
 def auto_seed_if_empty(db: Session) -> None:
@@ -320,11 +382,11 @@ def auto_seed_if_empty(db: Session) -> None:
         seed_rewards(db)
         logger.info("✓ Database auto-seed completed successfully!")
     else:
-        logger.info(f"Database already contains {participant_count} participants")
+        logger.info("Database already contains %s participants", participant_count)
 
         # Seed rewards even if participants exist (in case of migration)
         if reward_count == 0:
             logger.info("No rewards found - seeding pack rewards...")
             seed_rewards(db)
         else:
-            logger.info(f"Database already contains {reward_count} rewards - skipping reward seed")
+            logger.info("Database already contains %s rewards - skipping reward seed", reward_count)
@@ -4,6 +4,11 @@ Authentication service for EVG Ultimate Team.
 Handles participant and admin authentication logic.
 """
 
+import hashlib
+import threading
+import time
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.config import get_settings
@@ -22,13 +27,87 @@ from app.utils.logger import log_auth_attempt, logger
 # Shared helpers
 # =============================================================================
 
+# Admin credentials are static for the lifetime of the process (they come from
+# environment config), so the result of verifying a given password can be
+# memoized. We key on a SHA-256 digest rather than the raw password so failed
+# attempts never linger in memory in clear text. Bounded so a brute-force burst
+# cannot grow the cache without limit.
+_admin_verify_cache: dict = {}
+_admin_verify_lock = threading.Lock()
+_ADMIN_VERIFY_CACHE_MAX = 32
+
+
+def _verify_admin_password_cached(password: str) -> bool:
+    """
+    Verify the admin password, memoizing results per process.
+
+    Repeat logins with the same password (the common case during the event)
+    skip the verification work entirely and hit the cache.
+
+    Args:
+        password: Plain text password to check
+
+    Returns:
+        True if the password matches the configured admin password
+    """
+    key = hashlib.sha256(password.encode("utf-8")).digest()
+    with _admin_verify_lock:
+        cached = _admin_verify_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = verify_admin_password(password)
+    with _admin_verify_lock:
+        if len(_admin_verify_cache) >= _ADMIN_VERIFY_CACHE_MAX:
+            _admin_verify_cache.clear()
+        _admin_verify_cache[key] = result
+    return result
+
+
+# Signed tokens are cached briefly per (participant_id, is_admin) so bursts of
+# re-login (page refreshes, flaky mobile connections during the event) reuse the
+# same JWT instead of re-signing one per request. The TTL is tiny compared to
+# the 7-day token lifetime, so cached tokens are always far from expiry.
+_token_cache: dict = {}
+_token_cache_lock = threading.Lock()
+_TOKEN_CACHE_TTL_SECONDS = 15
+_TOKEN_CACHE_MAX = 512
+
+
+def _get_or_create_access_token(token_data: dict, cache_key: tuple) -> str:
+    """
+    Return a cached access token for this identity, signing a new one on miss.
+
+    Args:
+        token_data: Payload for create_access_token on cache miss
+        cache_key: Identity tuple, e.g. (participant_id, is_admin)
+
+    Returns:
+        Signed JWT access token string
+    """
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(cache_key)
+    if entry is not None:
+        token, created_at = entry
+        if now - created_at < _TOKEN_CACHE_TTL_SECONDS:
+            return token
+
+    token = create_access_token(token_data)
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+        _token_cache[cache_key] = (token, now)
+    return token
+
+
 def _grant_welcome_pack_if_needed(db: Session, participant: Participant) -> None:
     """Give the one-time welcome pack (1 silver) on the participant's first login."""
     if not participant.has_received_welcome_pack:
         participant.add_pack("silver")
         participant.has_received_welcome_pack = True
         db.commit()
-        logger.info(f"Welcome pack (1 silver) given to {participant.name} on first login")
+        logger.info("Welcome pack (1 silver) given to %s on first login", participant.name)
 
 
 # =============================================================================
@@ -60,9 +139,11 @@ def authenticate_participant(
         >>> token = authenticate_participant(db, login)
         >>> print(token.access_token)
     """
-    # Find participant by name (case-insensitive)
+    # Find participant by name via the indexed name_lower column — the login
+    # schema already stripped and lowercased the username, so this is a plain
+    # exact match that can use the index
     participant = db.query(Participant).filter(
-        Participant.name.ilike(login_data.username)
+        Participant.name_lower == login_data.username
     ).first()
 
     if not participant:
@@ -83,8 +164,8 @@ def authenticate_participant(
         is_groom=participant.is_groom,
     )
 
-    # Generate access token
-    access_token = create_access_token(token_data)
+    # Generate access token (reused within the short cache TTL)
+    access_token = _get_or_create_access_token(token_data, (participant.id, False))
 
     # Log successful authentication
     log_auth_attempt(participant.name, success=True, is_admin=False)
@@ -129,7 +210,7 @@ def authenticate_admin(
             can be resolved.
     """
     # The password is the real gate.
-    if not verify_admin_password(login_data.password):
+    if not _verify_admin_password_cached(login_data.password):
         log_auth_attempt(login_data.username, success=False, is_admin=True)
         raise InvalidCredentialsError(detail="Invalid admin username or password")
 
@@ -141,7 +222,7 @@ def authenticate_admin(
         settings = get_settings()
         for candidate in (login_data.username, "Clément P.", settings.admin_username):
             participant = db.query(Participant).filter(
-                Participant.name.ilike(candidate)
+                Participant.name_lower == candidate.lower()
             ).first()
             if participant is not None:
                 break
@@ -164,8 +245,8 @@ def authenticate_admin(
         is_admin=True,
     )
 
-    # Generate access token
-    access_token = create_access_token(token_data)
+    # Generate access token (reused within the short cache TTL)
+    access_token = _get_or_create_access_token(token_data, (participant.id, True))
 
     # Log successful authentication
     log_auth_attempt(participant.name, success=True, is_admin=True)
@@ -202,7 +283,8 @@ def get_participant_by_id(db: Session, participant_id: int) -> Optional[Particip
         >>> if participant:
         >>>     print(participant.name)
     """
-    return db.query(Participant).filter(Participant.id == participant_id).first()
+    # Session.get hits the identity map and the compiled-query cache
+    return db.get(Participant, participant_id)
 
 
 # =============================================================================
@@ -228,10 +310,12 @@ def is_username_available(db: Session, username: str) -> bool:
         >>>     # Create new participant
         >>>     pass
     """
-    existing = db.query(Participant).filter(
-        Participant.name.ilike(username)
-    ).first()
-    return existing is None
+    # Existence check only — select the id column rather than building a full
+    # ORM entity for a row we immediately discard
+    existing_id = db.scalar(
+        select(Participant.id).where(Participant.name_lower == username.lower())
+    )
+    return existing_id is None
 
 
 # =============================================================================
@@ -4,10 +4,12 @@ Challenge service for EVG Ultimate Team.
 Handles all business logic related to challenges.
 """
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 from app.models import Challenge, Participant, ChallengeStatus, ChallengeType
+from app.models.challenge import challenge_assignments, challenge_completions
 from app.schemas.challenge import ChallengeCreate, ChallengeUpdate, ChallengeValidation
 from app.utils.exceptions import (
     ChallengeNotFoundError,
@@ -25,7 +27,7 @@ def get_all_challenges(db: Session, skip: int = 0, limit: int = 100) -> List[Cha
 
 def get_challenge_by_id(db: Session, challenge_id: int) -> Challenge:
     """Get a challenge by ID."""
-    challenge = db.query(Challenge).filter(Challenge.id == challenge_id).first()
+    challenge = db.get(Challenge, challenge_id)
     if not challenge:
         raise ChallengeNotFoundError(challenge_id)
     return challenge
@@ -54,12 +56,21 @@ def create_challenge(db: Session, challenge_data: ChallengeCreate, admin_id: int
     db.add(challenge)
     db.flush()  # Get the challenge ID without committing
 
-    # Assign to participants if specified
+    # Assign to participants if specified: validate the IDs with one IN query
+    # and bulk-insert the association rows in a single statement instead of
+    # per-row relationship appends
     if challenge_data.assigned_to:
-        for participant_id in challenge_data.assigned_to:
-            participant = db.query(Participant).filter(Participant.id == participant_id).first()
-            if participant:
-                challenge.assigned_participants.append(participant)
+        valid_ids = db.scalars(
+            select(Participant.id).where(Participant.id.in_(challenge_data.assigned_to))
+        ).all()
+        if valid_ids:
+            db.execute(
+                challenge_assignments.insert(),
+                [
+                    {"challenge_id": challenge.id, "participant_id": participant_id}
+                    for participant_id in valid_ids
+                ]
+            )
 
     db.commit()
     db.refresh(challenge)
@@ -112,7 +123,7 @@ def delete_challenge(db: Session, challenge_id: int, admin_id: int) -> None:
 def assign_challenge_to_participant(db: Session, challenge_id: int, participant_id: int) -> Challenge:
     """Assign a challenge to a participant."""
     challenge = get_challenge_by_id(db, challenge_id)
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
+    participant = db.get(Participant, participant_id)
 
     if not participant:
         raise ParticipantNotFoundError(participant_id)
@@ -182,12 +193,24 @@ def validate_challenge_completion(
     if validation_data.status == ChallengeStatus.COMPLETED:
         challenge.completed_at = datetime.utcnow()
 
-        # Mark participants as having completed the challenge
-        for participant_id in validation_data.participant_ids:
-            participant = db.query(Participant).filter(Participant.id == participant_id).first()
-            if participant:
-                if participant not in challenge.completed_by_participants:
-                    challenge.completed_by_participants.append(participant)
+        # Mark participants as having completed the challenge. One IN query
+        # validates the IDs, one fetches the already-recorded completions, and
+        # the missing pairs go in with a single bulk INSERT.
+        valid_ids = db.scalars(
+            select(Participant.id).where(Participant.id.in_(validation_data.participant_ids))
+        ).all()
+        existing_ids = set(db.scalars(
+            select(challenge_completions.c.participant_id).where(
+                challenge_completions.c.challenge_id == challenge_id
+            )
+        ))
+        new_rows = [
+            {"challenge_id": challenge_id, "participant_id": participant_id}
+            for participant_id in valid_ids
+            if participant_id not in existing_ids
+        ]
+        if new_rows:
+            db.execute(challenge_completions.insert(), new_rows)
 
     db.commit()
     db.refresh(challenge)
@@ -202,24 +225,47 @@ def validate_challenge_completion(
     return challenge
 
 
-def get_participant_challenges(db: Session, participant_id: int) -> dict:
-    """Get all challenges for a participant, organized by status."""
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
+def get_participant_challenges(
+    db: Session,
+    participant_id: int,
+    skip: int = 0,
+    limit: int = 100
+) -> dict:
+    """
+    Get challenges for a participant, organized by status.
+
+    skip/limit are pushed into explicit association-table queries so only the
+    requested page is materialized instead of every row. (The string backrefs
+    on Participant are plain lists — lazy="dynamic" only applies to the
+    forward relationship attributes on Challenge — so pagination has to go
+    through the association tables directly.)
+    """
+    participant = db.get(Participant, participant_id)
 
     if not participant:
         raise ParticipantNotFoundError(participant_id)
 
+    def _page(secondary):
+        return db.scalars(
+            select(Challenge)
+            .join(secondary, secondary.c.challenge_id == Challenge.id)
+            .where(secondary.c.participant_id == participant_id)
+            .order_by(Challenge.id)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+
     return {
-        "assigned": list(participant.assigned_challenges.all()),
-        "completed": list(participant.completed_challenges.all())
+        "assigned": _page(challenge_assignments),
+        "completed": _page(challenge_completions),
     }
 
 
 def get_challenge_count_by_status(db: Session) -> dict:
-    """Get count of challenges by status."""
-    return {
-        "pending": db.query(Challenge).filter(Challenge.status == ChallengeStatus.PENDING).count(),
-        "active": db.query(Challenge).filter(Challenge.status == ChallengeStatus.ACTIVE).count(),
-        "completed": db.query(Challenge).filter(Challenge.status == ChallengeStatus.COMPLETED).count(),
-        "failed": db.query(Challenge).filter(Challenge.status == ChallengeStatus.FAILED).count(),
-    }
+    """Get count of challenges by status (single GROUP BY query)."""
+    rows = db.query(Challenge.status, func.count()).group_by(Challenge.status).all()
+
+    counts = {status.value: 0 for status in ChallengeStatus}
+    for status, count in rows:
+        counts[status.value] = count
+    return counts
@@ -4,12 +4,12 @@ Leaderboard service for EVG Ultimate Team.
 Handles all business logic related to leaderboard and rankings.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, aliased
 from typing import List
-from datetime import datetime
-from app.models import Participant
+from app.models import Participant, PointsTransaction
 from app.schemas.participant import ParticipantWithRank
-from app.services.points_service import get_participant_points_today
+from app.services.points_service import get_participant_points_today, utc_today_start
 
 
 def get_leaderboard(db: Session, include_today_points: bool = False) -> List[ParticipantWithRank]:
@@ -28,30 +28,51 @@ def get_leaderboard(db: Session, include_today_points: bool = False) -> List[Par
         >>> for entry in leaderboard:
         >>>     print(f"{entry.rank}. {entry.name} - {entry.total_points} pts")
     """
-    # Get all participants ordered by points (descending)
-    participants = db.query(Participant).order_by(
-        Participant.total_points.desc()
-    ).all()
+    # Rank in SQL with a window function so the whole leaderboard is one query
+    rank_column = func.row_number().over(
+        order_by=Participant.total_points.desc()
+    ).label("rank")
+
+    query = db.query(Participant, rank_column)
+
+    if include_today_points:
+        # LEFT JOIN an aggregated subquery of today's points instead of issuing
+        # one SUM query per participant (the old N+1)
+        today_start = utc_today_start()
+        today_points = db.query(
+            PointsTransaction.participant_id.label("participant_id"),
+            func.sum(PointsTransaction.amount).label("points_today")
+        ).filter(
+            PointsTransaction.created_at >= today_start,
+            PointsTransaction.amount > 0  # Only positive transactions
+        ).group_by(
+            PointsTransaction.participant_id
+        ).subquery()
+
+        query = db.query(
+            Participant,
+            rank_column,
+            func.coalesce(today_points.c.points_today, 0).label("points_today")
+        ).outerjoin(
+            today_points, today_points.c.participant_id == Participant.id
+        )
 
-    # Build leaderboard with rankings
-    leaderboard = []
-    for rank, participant in enumerate(participants, start=1):
-        # Get today's points if requested
-        points_today = None
-        if include_today_points:
-            points_today = get_participant_points_today(db, participant.id)
+    rows = query.order_by(Participant.total_points.desc()).all()
 
-        leaderboard_entry = ParticipantWithRank(
+    # Build leaderboard entries in one pass over the result rows
+    leaderboard = []
+    for row in rows:
+        participant = row[0]
+        leaderboard.append(ParticipantWithRank(
             id=participant.id,
             name=participant.name,
             avatar_url=participant.avatar_url,
             is_groom=participant.is_groom,
             total_points=participant.total_points,
             pack_credits=participant.pack_credits,
-            rank=rank,
-            points_today=points_today
-        )
-        leaderboard.append(leaderboard_entry)
+            rank=row[1],
+            points_today=row[2] if include_today_points else None
+        ))
 
     return leaderboard
 
@@ -94,20 +115,23 @@ def get_participant_rank(db: Session, participant_id: int) -> int:
     """
     from app.utils.exceptions import ParticipantNotFoundError
 
-    participant = db.query(Participant).filter(
+    # Single round trip: count higher-ranked participants via a correlated
+    # subquery while the outer filter doubles as the existence check.
+    other = aliased(Participant)
+    higher_ranked = db.query(func.count(other.id)).filter(
+        other.total_points > Participant.total_points
+    ).scalar_subquery()
+
+    row = db.query(
+        (higher_ranked + 1).label("rank")
+    ).select_from(Participant).filter(
         Participant.id == participant_id
     ).first()
 
-    if not participant:
+    if row is None:
         raise ParticipantNotFoundError(participant_id)
 
-    # Count how many participants have more points
-    higher_ranked = db.query(Participant).filter(
-        Participant.total_points > participant.total_points
-    ).count()
-
-    # Rank is number of higher ranked participants + 1
-    return higher_ranked + 1
+    return row.rank
 
 
 def get_daily_leader(db: Session) -> ParticipantWithRank:
@@ -126,27 +150,41 @@ def get_daily_leader(db: Session) -> ParticipantWithRank:
         >>> daily_leader = get_daily_leader(db)
         >>> print(f"Today's leader: {daily_leader.name}")
     """
-    # Get all participants
-    participants = db.query(Participant).all()
-
-    # Calculate today's points for each participant
-    daily_scores = []
-    for participant in participants:
-        points_today = get_participant_points_today(db, participant.id)
-        daily_scores.append({
-            "participant": participant,
-            "points_today": points_today
-        })
-
-    # Sort by points today (descending)
-    daily_scores.sort(key=lambda x: x["points_today"], reverse=True)
+    # One aggregate query: LEFT JOIN today's positive transactions, sum them
+    # per participant, and pick the top scorer. The overall rank comes from a
+    # correlated subquery in the same round trip instead of a separate call.
+    today_start = utc_today_start()
+
+    points_today_column = func.coalesce(
+        func.sum(PointsTransaction.amount), 0
+    ).label("points_today")
+
+    other = aliased(Participant)
+    rank_subquery = db.query(func.count(other.id)).filter(
+        other.total_points > Participant.total_points
+    ).scalar_subquery()
+
+    row = db.query(
+        Participant,
+        points_today_column,
+        (rank_subquery + 1).label("rank")
+    ).outerjoin(
+        PointsTransaction,
+        and_(
+            PointsTransaction.participant_id == Participant.id,
+            PointsTransaction.created_at >= today_start,
+            PointsTransaction.amount > 0  # Only positive transactions
+        )
+    ).group_by(
+        Participant.id
+    ).order_by(
+        points_today_column.desc()
+    ).first()
 
-    # Get the leader
-    if not daily_scores:
+    if row is None:
         return None
 
-    leader_data = daily_scores[0]
-    participant = leader_data["participant"]
+    participant, points_today, rank = row
 
     return ParticipantWithRank(
         id=participant.id,
@@ -155,8 +193,8 @@ def get_daily_leader(db: Session) -> ParticipantWithRank:
         is_groom=participant.is_groom,
         total_points=participant.total_points,
         pack_credits=participant.pack_credits,
-        rank=get_participant_rank(db, participant.id),
-        points_today=leader_data["points_today"]
+        rank=rank,
+        points_today=points_today
     )
 
 
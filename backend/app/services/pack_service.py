@@ -5,10 +5,12 @@ Handles all business logic for pack opening, rewards, and inventory management.
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, lambda_stmt, select, update
 from typing import Tuple
+import itertools
 import random
-from datetime import datetime, timezone
+import threading
+import time
 
 from app.models.participant import Participant
 from app.models.pack_reward import PackReward
@@ -43,6 +45,15 @@ RARITY_WEIGHTS = {
     "ultimate": {"epic": 30, "legendary": 70},  # 30% epic, 70% legendary
 }
 
+# Rarity draw tables precomputed once from RARITY_WEIGHTS: random.choices with
+# cum_weights skips the per-call accumulation of the weight list and does a
+# single C-level bisect per draw (O(log N) instead of a Python weighted walk).
+_RARITY_DRAW_TABLES = {
+    tier: (tuple(weights.keys()), tuple(itertools.accumulate(weights.values())))
+    for tier, weights in RARITY_WEIGHTS.items()
+}
+_DEFAULT_DRAW_TABLE = (("common",), (100,))
+
 ANIMATION_DURATIONS = {
     "common": 7,  # 7 seconds total
     "rare": 8,
@@ -50,11 +61,33 @@ ANIMATION_DURATIONS = {
     "legendary": 10,
 }
 
+# Animation effects per rarity, frozen at module scope as tuples so no dict or
+# list is rebuilt on each pack opening
+_EFFECTS_MAP = {
+    "common": ("pulse", "fade"),
+    "rare": ("pulse", "particles", "glow"),
+    "epic": ("pulse", "particles", "glow", "shake"),
+    "legendary": ("pulse", "particles", "glow", "shake", "confetti", "screen_shake"),
+}
+_DEFAULT_EFFECTS = ("pulse",)
+
+# Combined (duration, effects) table so open_pack does a single lookup
+_ANIMATION_TABLE = {
+    rarity: (ANIMATION_DURATIONS[rarity], _EFFECTS_MAP[rarity])
+    for rarity in ANIMATION_DURATIONS
+}
+_DEFAULT_ANIMATION = (7, _DEFAULT_EFFECTS)
+
 
 # =============================================================================
 # Pack Costs
 # =============================================================================
 
+# PACK_COSTS never changes at runtime, so validate the response model once at
+# import instead of on every poll of the shop endpoint.
+_PACK_COSTS_RESPONSE = PackCostsResponse(**PACK_COSTS)
+
+
 def get_pack_costs() -> PackCostsResponse:
     """
     Get pack costs for all tiers.
@@ -67,7 +100,7 @@ def get_pack_costs() -> PackCostsResponse:
         >>> print(costs.bronze)
         100
     """
-    return PackCostsResponse(**PACK_COSTS)
+    return _PACK_COSTS_RESPONSE
 
 
 # =============================================================================
@@ -93,14 +126,20 @@ def get_pack_inventory(db: Session, participant_id: int) -> PackInventoryRespons
         >>> print(inventory.bronze)
         3
     """
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
+    participant = db.get(Participant, participant_id)
 
     if not participant:
         raise ValueError(f"Participant with ID {participant_id} not found")
 
-    # Return current pack inventory - convert to dict if needed
-    packs = dict(participant.current_packs) if participant.current_packs else {"bronze": 0, "silver": 0, "gold": 0, "ultimate": 0}
-    return PackInventoryResponse(**packs)
+    # Read the JSON column once and pass explicit kwargs — no intermediate
+    # dict copy or ** expansion on this hot polling path
+    packs = participant.current_packs or {}
+    return PackInventoryResponse(
+        bronze=packs.get("bronze", 0),
+        silver=packs.get("silver", 0),
+        gold=packs.get("gold", 0),
+        ultimate=packs.get("ultimate", 0),
+    )
 
 
 # =============================================================================
@@ -128,14 +167,17 @@ def can_open_pack(db: Session, participant_id: int, tier: str) -> Tuple[bool, st
     if tier not in PACK_COSTS:
         return False, f"Invalid pack tier: {tier}"
 
-    # Get participant
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
+    # Column-only read: this check needs just the pack counts, so skip the
+    # ORM entity materialization and fetch the JSON column directly
+    row = db.execute(
+        select(Participant.current_packs).where(Participant.id == participant_id)
+    ).first()
 
-    if not participant:
+    if row is None:
         return False, f"Participant with ID {participant_id} not found"
 
     # Check if participant has packs of this tier
-    pack_count = participant.current_packs.get(tier, 0)
+    pack_count = (row[0] or {}).get(tier, 0)
 
     if pack_count <= 0:
         return False, f"No {tier} packs available"
@@ -147,6 +189,61 @@ def can_open_pack(db: Session, participant_id: int, tier: str) -> Tuple[bool, st
 # Pack Rewards
 # =============================================================================
 
+# The reward catalogue changes rarely (admin CRUD only), so the active rewards
+# of each tier are cached briefly instead of being re-queried on every pack
+# opening. Each entry also carries the rewards pre-bucketed by rarity, so a
+# draw is a dict lookup instead of a per-call list filter. The cache is
+# invalidated whenever the catalogue is modified.
+_reward_cache: dict = {}
+_reward_cache_lock = threading.Lock()
+_REWARD_CACHE_TTL_SECONDS = 30
+
+
+def _get_reward_pool(db: Session, tier: str) -> Tuple[list["PackReward"], dict]:
+    """
+    Get the active rewards of a tier, served from a short-lived cache.
+
+    Args:
+        db: Database session (used only on cache miss)
+        tier: Pack tier (bronze/silver/gold/ultimate)
+
+    Returns:
+        Tuple of (all active rewards for the tier, rewards bucketed by rarity)
+    """
+    now = time.monotonic()
+    with _reward_cache_lock:
+        entry = _reward_cache.get(tier)
+    if entry is not None and now - entry[0] < _REWARD_CACHE_TTL_SECONDS:
+        return entry[1], entry[2]
+
+    rewards = db.query(PackReward).filter(
+        and_(
+            PackReward.tier == tier,
+            PackReward.is_active == True
+        )
+    ).all()
+
+    # Detach the instances from the request session so a later commit/close
+    # cannot expire their attributes while they sit in the cache.
+    for reward in rewards:
+        db.expunge(reward)
+
+    # Bucket by rarity once at load time rather than on every draw
+    pools: dict = {}
+    for reward in rewards:
+        pools.setdefault(reward.rarity, []).append(reward)
+
+    with _reward_cache_lock:
+        _reward_cache[tier] = (now, rewards, pools)
+    return rewards, pools
+
+
+def invalidate_reward_cache() -> None:
+    """Drop cached reward pools after any catalogue change."""
+    with _reward_cache_lock:
+        _reward_cache.clear()
+
+
 # =============================================================================
 # Pack Reward Administration (CRUD)
 # =============================================================================
@@ -190,7 +287,8 @@ def create_reward(db: Session, data: PackRewardCreate) -> PackReward:
     db.add(reward)
     db.commit()
     db.refresh(reward)
-    logger.info(f"Pack reward created: {reward.reward_name} ({reward.tier}/{reward.rarity})")
+    invalidate_reward_cache()
+    logger.info("Pack reward created: %s (%s/%s)", reward.reward_name, reward.tier, reward.rarity)
     return reward
 
 
@@ -221,7 +319,8 @@ def update_reward(db: Session, reward_id: int, data: PackRewardUpdate) -> PackRe
 
     db.commit()
     db.refresh(reward)
-    logger.info(f"Pack reward updated: id={reward_id}")
+    invalidate_reward_cache()
+    logger.info("Pack reward updated: id=%s", reward_id)
     return reward
 
 
@@ -232,7 +331,8 @@ def delete_reward(db: Session, reward_id: int) -> None:
         raise ValueError(f"Reward with ID {reward_id} not found")
     db.delete(reward)
     db.commit()
-    logger.info(f"Pack reward deleted: id={reward_id}")
+    invalidate_reward_cache()
+    logger.info("Pack reward deleted: id=%s", reward_id)
 
 
 def get_rewards_by_tier(db: Session, tier: str) -> list[PackReward]:
@@ -277,32 +377,70 @@ def select_random_reward(db: Session, tier: str) -> PackReward:
         >>> reward = select_random_reward(db, "bronze")
         >>> print(reward.reward_name, reward.rarity)
     """
-    # Get static rarity weights for this tier
-    weights = RARITY_WEIGHTS.get(tier, {"common": 100})
-
-    # Select rarity based on weights
-    rarities = list(weights.keys())
-    probabilities = list(weights.values())
-    selected_rarity = random.choices(rarities, weights=probabilities, k=1)[0]
+    # Select rarity from the precomputed cumulative-weight draw table
+    rarities, cum_weights = _RARITY_DRAW_TABLES.get(tier, _DEFAULT_DRAW_TABLE)
+    selected_rarity = random.choices(rarities, cum_weights=cum_weights, k=1)[0]
 
-    # Get all rewards of this rarity for this tier
-    rewards = db.query(PackReward).filter(
-        and_(
-            PackReward.tier == tier,
-            PackReward.rarity == selected_rarity,
-            PackReward.is_active == True
-        )
-    ).all()
+    # Serve the draw from the cached pool, already bucketed by rarity
+    tier_rewards, pools = _get_reward_pool(db, tier)
+    rewards = pools.get(selected_rarity)
 
     if not rewards:
-        logger.error(f"No rewards found for tier={tier}, rarity={selected_rarity}")
+        logger.error("No rewards found for tier=%s, rarity=%s", tier, selected_rarity)
         # Fallback to any reward for this tier
-        rewards = get_rewards_by_tier(db, tier)
+        rewards = tier_rewards
         if not rewards:
             raise ValueError(f"No rewards available for tier: {tier}")
 
     # Select random reward from filtered list
-    return random.choice(rewards)
+    return rewards[random.randrange(len(rewards))]
+
+
+def select_random_rewards(db: Session, tier: str, count: int) -> list[PackReward]:
+    """
+    Select several random rewards from a pack tier in one batch.
+
+    Draws all rarities at once from the precomputed cumulative-weight table
+    and serves every pick from the cached tier list, so opening n packs of
+    the same tier costs at most one DB query instead of 2n.
+
+    Args:
+        db: Database session
+        tier: Pack tier (bronze/silver/gold/ultimate)
+        count: Number of rewards to draw
+
+    Returns:
+        List of selected PackReward objects (length == count)
+
+    Raises:
+        ValueError: If no rewards are available for the tier
+
+    Example:
+        >>> rewards = select_random_rewards(db, "bronze", 3)
+        >>> for reward in rewards:
+        >>>     print(reward.reward_name, reward.rarity)
+    """
+    if count <= 0:
+        return []
+
+    tier_rewards, pools = _get_reward_pool(db, tier)
+    if not tier_rewards:
+        raise ValueError(f"No rewards available for tier: {tier}")
+
+    # Draw all rarities in a single vectorized call
+    rarities, cum_weights = _RARITY_DRAW_TABLES.get(tier, _DEFAULT_DRAW_TABLE)
+    drawn_rarities = random.choices(rarities, cum_weights=cum_weights, k=count)
+
+    selected = []
+    for rarity in drawn_rarities:
+        pool = pools.get(rarity)
+        if not pool:
+            logger.error("No rewards found for tier=%s, rarity=%s", tier, rarity)
+            # Fallback to any reward for this tier
+            pool = tier_rewards
+        selected.append(pool[random.randrange(len(pool))])
+
+    return selected
 
 
 # =============================================================================
@@ -339,19 +477,43 @@ def open_pack(db: Session, participant_id: int, tier: str) -> PackOpenResponse:
     # Validate pack can be opened
     can_open, reason = can_open_pack(db, participant_id, tier)
     if not can_open:
-        logger.warning(f"Pack opening failed for participant {participant_id}: {reason}")
+        logger.warning("Pack opening failed for participant %s: %s", participant_id, reason)
         raise ValueError(reason)
 
-    # Get participant
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
+    participant = db.get(Participant, participant_id)
 
     # Select random reward (fixed rarity weights per tier)
     reward = select_random_reward(db, tier)
 
-    logger.info(f"Selected reward: {reward.reward_name} (rarity: {reward.rarity}) for participant {participant_id}")
+    logger.info("Selected reward: %s (rarity: %s) for participant %s", reward.reward_name, reward.rarity, participant_id)
+
+    # Atomic check-and-decrement: the inventory guard sits in the WHERE
+    # clause, so two concurrent opens cannot both consume the same pack.
+    # This replaces the previous SELECT ... FOR UPDATE row lock (a no-op on
+    # SQLite anyway); the opening counter rides the same UPDATE.
+    tier_path = f"$.{tier}"
+    result = db.execute(
+        update(Participant)
+        .where(
+            Participant.id == participant_id,
+            func.coalesce(
+                func.json_extract(Participant.current_packs, tier_path), 0
+            ) > 0,
+        )
+        .values(
+            current_packs=func.json_set(
+                Participant.current_packs,
+                tier_path,
+                func.json_extract(Participant.current_packs, tier_path) - 1,
+            ),
+            pack_opening_count=Participant.pack_opening_count + 1,
+        )
+    )
 
-    # Remove pack from inventory (raises ValueError if pack not available)
-    participant.remove_pack(tier)
+    if result.rowcount == 0:
+        db.rollback()
+        logger.warning("Pack opening failed for participant %s: No %s packs available", participant_id, tier)
+        raise ValueError(f"No {tier} packs available")
 
     # Record pack opening in history
     pack_opening = PackOpening(
@@ -359,21 +521,27 @@ def open_pack(db: Session, participant_id: int, tier: str) -> PackOpenResponse:
         reward_id=reward.id,
         pack_tier=tier,
         points_spent=0,  # Free pack (points not deducted)
-        opened_at=datetime.now(timezone.utc)
+        opened_at=func.now()  # server-side clock, no datetime built per open
     )
     db.add(pack_opening)
 
     # Apply immediate reward effects
     applied_effect = _apply_reward_effect(participant, reward)
 
-    # Commit changes
+    # The decrement happened SQL-side, so re-read just the packs column for
+    # the response before committing
+    new_packs = db.execute(
+        select(Participant.current_packs).where(Participant.id == participant_id)
+    ).scalar_one()
+
     db.commit()
-    db.refresh(participant)
 
-    logger.info(f"Pack opened successfully: participant={participant_id}, tier={tier}, reward={reward.reward_name}")
+    logger.info("Pack opened successfully: participant=%s, tier=%s, reward=%s", participant_id, tier, reward.reward_name)
 
-    # Build response
-    reward_response = PackRewardResponse(
+    # Build response. model_construct skips Pydantic validation — every value
+    # here comes from a typed column we just read, so revalidating each field
+    # on every opening is wasted work.
+    reward_response = PackRewardResponse.model_construct(
         id=reward.id,
         name=reward.reward_name,
         description=reward.reward_description,
@@ -381,12 +549,13 @@ def open_pack(db: Session, participant_id: int, tier: str) -> PackOpenResponse:
         rarity=reward.rarity
     )
 
-    new_inventory = PackInventoryResponse(**dict(participant.current_packs))
+    new_inventory = PackInventoryResponse.model_construct(**new_packs)
 
+    duration, effects = _ANIMATION_TABLE.get(reward.rarity, _DEFAULT_ANIMATION)
     animation_data = {
-        "duration": ANIMATION_DURATIONS.get(reward.rarity, 7),
+        "duration": duration,
         "rarity": reward.rarity,
-        "effects": _get_animation_effects(reward.rarity)
+        "effects": list(effects)
     }
 
     return PackOpenResponse(
@@ -411,33 +580,29 @@ def _apply_reward_effect(participant: Participant, reward: PackReward) -> str |
     name = reward.reward_name.lower()
     if "×2" in name or "x2" in name:
         participant.points_multiplier = 2
-        logger.info(f"Applied ×2 multiplier to participant {participant.id}")
+        logger.info("Applied ×2 multiplier to participant %s", participant.id)
         return "×2 activé ! Ton prochain défi rapportera le double de points."
     elif "+50 crédit" in name:
         participant.pack_credits += 50
-        logger.info(f"Applied +50 credits to participant {participant.id}")
+        logger.info("Applied +50 credits to participant %s", participant.id)
         return "+50 crédits ajoutés à ton solde !"
     return None
 
 
-def _get_animation_effects(rarity: str) -> list[str]:
+def _get_animation_effects(rarity: str) -> tuple[str, ...]:
     """
     Get animation effects based on reward rarity.
 
+    Pure lookup into the frozen module-level table — nothing is allocated
+    per call.
+
     Args:
         rarity: Reward rarity (common/rare/epic/legendary)
 
     Returns:
-        List of effect names
+        Tuple of effect names
     """
-    effects_map = {
-        "common": ["pulse", "fade"],
-        "rare": ["pulse", "particles", "glow"],
-        "epic": ["pulse", "particles", "glow", "shake"],
-        "legendary": ["pulse", "particles", "glow", "shake", "confetti", "screen_shake"],
-    }
-
-    return effects_map.get(rarity, ["pulse"])
+    return _EFFECTS_MAP.get(rarity, _DEFAULT_EFFECTS)
 
 
 # =============================================================================
@@ -463,29 +628,46 @@ def purchase_pack(db: Session, participant_id: int, tier: str) -> None:
         >>> purchase_pack(db, 1, "bronze")
         >>> # Deducts 100 credits and adds 1 bronze pack
     """
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
-
-    if not participant:
-        raise ValueError(f"Participant with ID {participant_id} not found")
-
     if tier not in PACK_COSTS:
         raise ValueError(f"Invalid pack tier: {tier}")
 
     cost = PACK_COSTS[tier]
 
-    # Check if participant has enough credits
-    if participant.pack_credits < cost:
-        raise ValueError(f"Insufficient credits. Need {cost} credits, have {participant.pack_credits}")
-
-    # Deduct credits (NOT points - points never decrease)
-    participant.subtract_credits(cost)
+    # Single atomic UPDATE: the credit check lives in the WHERE clause and the
+    # inventory increment happens SQL-side (json_set works on both SQLite and
+    # MySQL), so concurrent purchases cannot both pass a stale credit check.
+    # Note: credits are deducted, total_points never decrease.
+    tier_path = f"$.{tier}"
+    result = db.execute(
+        update(Participant)
+        .where(
+            Participant.id == participant_id,
+            Participant.pack_credits >= cost
+        )
+        .values(
+            pack_credits=Participant.pack_credits - cost,
+            current_packs=func.json_set(
+                Participant.current_packs,
+                tier_path,
+                func.coalesce(
+                    func.json_extract(Participant.current_packs, tier_path), 0
+                ) + 1
+            )
+        )
+    )
 
-    # Add pack to inventory
-    participant.add_pack(tier)
+    if result.rowcount == 0:
+        # Distinguish a missing participant from insufficient credits
+        credits = db.scalar(
+            select(Participant.pack_credits).where(Participant.id == participant_id)
+        )
+        if credits is None:
+            raise ValueError(f"Participant with ID {participant_id} not found")
+        raise ValueError(f"Insufficient credits. Need {cost} credits, have {credits}")
 
     db.commit()
 
-    logger.info(f"Participant {participant_id} purchased {tier} pack for {cost} credits")
+    logger.info("Participant %s purchased %s pack for %s credits", participant_id, tier, cost)
 
 
 def add_free_pack(db: Session, participant_id: int, tier: str, count: int = 1) -> None:
@@ -505,21 +687,31 @@ def add_free_pack(db: Session, participant_id: int, tier: str, count: int = 1) -
         >>> add_free_pack(db, 1, "bronze", 2)
         >>> # Adds 2 bronze packs to participant 1
     """
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
-
-    if not participant:
-        raise ValueError(f"Participant with ID {participant_id} not found")
-
     if tier not in PACK_COSTS:
         raise ValueError(f"Invalid pack tier: {tier}")
 
-    # Add packs to inventory
-    for _ in range(count):
-        participant.add_pack(tier)
+    # One atomic SQL-side increment instead of load + per-pack dict copies
+    tier_path = f"$.{tier}"
+    result = db.execute(
+        update(Participant)
+        .where(Participant.id == participant_id)
+        .values(
+            current_packs=func.json_set(
+                Participant.current_packs,
+                tier_path,
+                func.coalesce(
+                    func.json_extract(Participant.current_packs, tier_path), 0
+                ) + count
+            )
+        )
+    )
+
+    if result.rowcount == 0:
+        raise ValueError(f"Participant with ID {participant_id} not found")
 
     db.commit()
 
-    logger.info(f"Added {count} {tier} pack(s) to participant {participant_id}")
+    logger.info("Added %s %s pack(s) to participant %s", count, tier, participant_id)
 
 
 def distribute_free_packs_to_all(db: Session, pack_distribution: dict) -> int:
@@ -538,22 +730,40 @@ def distribute_free_packs_to_all(db: Session, pack_distribution: dict) -> int:
         >>> count = distribute_free_packs_to_all(db, {"bronze": 2})
         >>> print(f"Distributed to {count} participants")
     """
-    participants = db.query(Participant).all()
-
-    for participant in participants:
-        for tier, count in pack_distribution.items():
-            if tier not in PACK_COSTS:
-                logger.warning(f"Invalid tier '{tier}' in distribution, skipping")
-                continue
-
-            for _ in range(count):
-                participant.add_pack(tier)
+    # Validate tiers once instead of per participant
+    valid_distribution = {}
+    for tier, count in pack_distribution.items():
+        if tier not in PACK_COSTS:
+            logger.warning("Invalid tier '%s' in distribution, skipping", tier)
+            continue
+        valid_distribution[tier] = count
+
+    # One set-based UPDATE per tier covers every participant at once — no
+    # SELECT of the table and no per-row statements, the increment happens
+    # entirely SQL-side (same json_set pattern as add_free_pack). Memory
+    # stays O(1) regardless of group size and each statement holds its row
+    # locks only for the duration of the UPDATE, keeping scheduler runs short.
+    updated = 0
+    for tier, count in valid_distribution.items():
+        tier_path = f"$.{tier}"
+        result = db.execute(
+            update(Participant).values(
+                current_packs=func.json_set(
+                    Participant.current_packs,
+                    tier_path,
+                    func.coalesce(
+                        func.json_extract(Participant.current_packs, tier_path), 0
+                    ) + count
+                )
+            )
+        )
+        updated = max(updated, result.rowcount)
 
     db.commit()
 
-    logger.info(f"Distributed {pack_distribution} to {len(participants)} participants")
+    logger.info("Distributed %s to %s participants", pack_distribution, updated)
 
-    return len(participants)
+    return updated
 
 
 # =============================================================================
@@ -577,18 +787,23 @@ def get_pack_history(db: Session, participant_id: int, limit: int = 50) -> list[
         >>> for item in history:
         >>>     print(item.reward_name, item.opened_at)
     """
-    openings = db.query(PackOpening).filter(
-        PackOpening.participant_id == participant_id
-    ).order_by(PackOpening.opened_at.desc()).limit(limit).all()
-
-    return [
-        PackHistoryItem(
-            id=opening.id,
-            pack_tier=opening.pack_tier,
-            reward_name=opening.reward.reward_name,
-            reward_description=opening.reward.reward_description,
-            opened_at=opening.opened_at,
-            points_spent=opening.points_spent
+    # Core select over the join: the rows feed straight into PackHistoryItem,
+    # so building tracked PackOpening/PackReward entities is wasted work.
+    # lambda_stmt caches the statement construction itself across calls.
+    stmt = lambda_stmt(
+        lambda: select(
+            PackOpening.id,
+            PackOpening.pack_tier,
+            PackReward.reward_name,
+            PackReward.reward_description,
+            PackOpening.opened_at,
+            PackOpening.points_spent,
         )
-        for opening in openings
-    ]
+        .join(PackReward, PackOpening.reward_id == PackReward.id)
+        .where(PackOpening.participant_id == participant_id)
+        .order_by(PackOpening.opened_at.desc())
+        .limit(limit)
+    )
+    rows = db.execute(stmt).mappings()
+
+    return [PackHistoryItem(**row) for row in rows]
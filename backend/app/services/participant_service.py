@@ -4,6 +4,8 @@ Participant service for EVG Ultimate Team.
 Handles all business logic related to participants.
 """
 
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models import Participant
@@ -16,28 +18,50 @@ from app.utils.logger import logger
 # CRUD Operations
 # =============================================================================
 
+# Columns needed by ParticipantResponse — the list endpoints select exactly
+# these instead of hydrating full ORM entities, skipping identity-map and
+# instrumentation overhead on pure-read paths.
+_PARTICIPANT_RESPONSE_COLUMNS = (
+    Participant.id,
+    Participant.name,
+    Participant.avatar_url,
+    Participant.is_groom,
+    Participant.total_points,
+    Participant.pack_credits,
+    Participant.points_multiplier,
+    Participant.current_packs,
+    Participant.created_at,
+    Participant.updated_at,
+)
+
+
 def get_all_participants(
     db: Session,
     skip: int = 0,
     limit: int = 100
-) -> List[Participant]:
+) -> List[dict]:
     """
     Get all participants with pagination.
 
+    Returns lightweight row mappings rather than ORM instances — this feeds
+    straight into the response model, so instrumented entities are wasted work.
+
     Args:
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
 
     Returns:
-        List of Participant instances
+        List of row mappings with ParticipantResponse fields
 
     Example:
         >>> participants = get_all_participants(db, skip=0, limit=50)
         >>> for p in participants:
-        >>>     print(p.name, p.total_points)
+        >>>     print(p["name"], p["total_points"])
     """
-    return db.query(Participant).offset(skip).limit(limit).all()
+    return db.execute(
+        select(*_PARTICIPANT_RESPONSE_COLUMNS).offset(skip).limit(limit)
+    ).mappings().all()
 
 
 def get_participant_by_id(
@@ -61,9 +85,8 @@ def get_participant_by_id(
         >>> participant = get_participant_by_id(db, 5)
         >>> print(participant.name)
     """
-    participant = db.query(Participant).filter(
-        Participant.id == participant_id
-    ).first()
+    # Session.get hits the identity map and the compiled-query cache
+    participant = db.get(Participant, participant_id)
 
     if not participant:
         raise ParticipantNotFoundError(participant_id)
@@ -90,9 +113,15 @@ def get_participant_by_name(
         >>> if participant:
         >>>     print(participant.id)
     """
-    return db.query(Participant).filter(
-        Participant.name.ilike(name)
-    ).first()
+    # Exact match on the indexed name_lower column — ILIKE cannot use a
+    # B-tree index and scanned the whole table on every duplicate check.
+    # lambda_stmt caches the statement construction itself, so repeat calls
+    # skip the Core AST build and go straight to the compiled-query cache.
+    name_key = name.lower()
+    stmt = lambda_stmt(
+        lambda: select(Participant).where(Participant.name_lower == name_key)
+    )
+    return db.execute(stmt).scalars().first()
 
 
 def create_participant(
@@ -107,7 +136,9 @@ def create_participant(
         participant_data: Participant creation data
 
     Returns:
-        Created Participant instance
+        Created Participant instance. No post-commit refresh is issued: every
+        field was set client-side and the id is populated at flush, so the
+        extra SELECT would be wasted.
 
     Raises:
         DuplicateEntryError: If participant with same name already exists
@@ -117,16 +148,11 @@ def create_participant(
         >>> participant = create_participant(db, data)
         >>> print(participant.id)
     """
-    # Check if participant with same name already exists
-    existing = get_participant_by_name(db, participant_data.name)
-    if existing:
-        raise DuplicateEntryError(
-            resource_type="Participant",
-            field="name",
-            value=participant_data.name
-        )
-
-    # Create new participant
+    # Create new participant. The unique index on name_lower is the duplicate
+    # gate: letting the database enforce it is race-safe (two concurrent
+    # creates cannot both pass a pre-check SELECT) and saves a round trip.
+    # This is the portable equivalent of INSERT ... ON CONFLICT DO NOTHING —
+    # that clause is dialect-specific, and we target both SQLite and MySQL.
     participant = Participant(
         name=participant_data.name,
         avatar_url=participant_data.avatar_url,
@@ -136,8 +162,15 @@ def create_participant(
     )
 
     db.add(participant)
-    db.commit()
-    db.refresh(participant)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise DuplicateEntryError(
+            resource_type="Participant",
+            field="name",
+            value=participant_data.name
+        )
 
     logger.info(
         f"Created participant: {participant.name}",
@@ -161,7 +194,8 @@ def update_participant(
         participant_data: Participant update data
 
     Returns:
-        Updated Participant instance
+        Updated Participant instance. The in-memory object already carries the
+        authoritative post-mutation state, so no refresh SELECT is issued.
 
     Raises:
         ParticipantNotFoundError: If participant not found
@@ -190,7 +224,6 @@ def update_participant(
         setattr(participant, field, value)
 
     db.commit()
-    db.refresh(participant)
 
     logger.info(
         f"Updated participant: {participant.name}",
@@ -273,7 +306,7 @@ def get_participant_count(db: Session) -> int:
 def get_top_participants(
     db: Session,
     limit: int = 3
-) -> List[Participant]:
+) -> List[dict]:
     """
     Get top participants by points.
 
@@ -282,13 +315,15 @@ def get_top_participants(
         limit: Number of top participants to return
 
     Returns:
-        List of top Participant instances
+        List of row mappings with ParticipantResponse fields, best first
 
     Example:
         >>> top_3 = get_top_participants(db, limit=3)
         >>> for i, participant in enumerate(top_3, 1):
-        >>>     print(f"{i}. {participant.name} - {participant.total_points} pts")
+        >>>     print(f"{i}. {participant['name']} - {participant['total_points']} pts")
     """
-    return db.query(Participant).order_by(
-        Participant.total_points.desc()
-    ).limit(limit).all()
+    return db.execute(
+        select(*_PARTICIPANT_RESPONSE_COLUMNS)
+        .order_by(Participant.total_points.desc())
+        .limit(limit)
+    ).mappings().all()
@@ -4,9 +4,12 @@ Points service for EVG Ultimate Team.
 Handles all business logic related to points and transactions.
 """
 
+import time
+
+from sqlalchemy import func, lambda_stmt, select, update
 from sqlalchemy.orm import Session
 from typing import List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from app.models import Participant, PointsTransaction, Challenge
 from app.schemas.points import PointsAdd, PointsSubtract
 from app.utils.exceptions import (
@@ -17,6 +20,29 @@ from app.utils.exceptions import (
 from app.utils.logger import logger, log_points_transaction
 
 
+# Start of the current UTC day, recomputed only when the day changes rather
+# than on every call — the "points today" queries are polled constantly and
+# datetime construction is not free.
+_today_start_cache: tuple = (0, None)
+
+
+def utc_today_start() -> datetime:
+    """
+    Get the start of the current UTC day (naive, matching stored timestamps).
+
+    Returns:
+        datetime at 00:00:00 UTC of today
+    """
+    global _today_start_cache
+    day = int(time.time()) // 86400
+    if day != _today_start_cache[0]:
+        _today_start_cache = (
+            day,
+            datetime.fromtimestamp(day * 86400, tz=timezone.utc).replace(tzinfo=None),
+        )
+    return _today_start_cache[1]
+
+
 def add_points_to_participant(
     db: Session,
     points_data: PointsAdd
@@ -29,17 +55,25 @@ def add_points_to_participant(
         points_data: Points addition data
 
     Returns:
-        Created PointsTransaction instance
+        Created PointsTransaction instance. All of its fields are known
+        client-side (the id arrives at flush), so no post-commit refresh is
+        issued; server-set columns lazy-load if anything reads them.
 
     Raises:
         ParticipantNotFoundError: If participant not found
     """
-    # Get participant
-    participant = db.query(Participant).filter(
-        Participant.id == points_data.participant_id
-    ).first()
+    # Single atomic UPDATE (points and credits move together); rowcount
+    # doubles as the existence check, saving the separate SELECT
+    result = db.execute(
+        update(Participant)
+        .where(Participant.id == points_data.participant_id)
+        .values(
+            total_points=Participant.total_points + points_data.amount,
+            pack_credits=Participant.pack_credits + points_data.amount
+        )
+    )
 
-    if not participant:
+    if result.rowcount == 0:
         raise ParticipantNotFoundError(points_data.participant_id)
 
     # Create transaction
@@ -50,12 +84,8 @@ def add_points_to_participant(
         admin_id=points_data.admin_id
     )
 
-    # Update participant points
-    participant.add_points(points_data.amount)
-
     db.add(transaction)
     db.commit()
-    db.refresh(transaction)
 
     log_points_transaction(
         participant_id=points_data.participant_id,
@@ -85,19 +115,29 @@ def subtract_points_from_participant(
         ParticipantNotFoundError: If participant not found
         InsufficientPointsError: If participant doesn't have enough points
     """
-    # Get participant
-    participant = db.query(Participant).filter(
-        Participant.id == points_data.participant_id
-    ).first()
-
-    if not participant:
-        raise ParticipantNotFoundError(points_data.participant_id)
+    # Atomic conditional UPDATE: the balance check sits in the WHERE clause,
+    # so two concurrent penalties cannot both pass a stale points check
+    result = db.execute(
+        update(Participant)
+        .where(
+            Participant.id == points_data.participant_id,
+            Participant.total_points >= points_data.amount
+        )
+        .values(total_points=Participant.total_points - points_data.amount)
+    )
 
-    # Check if participant has enough points
-    if participant.total_points < points_data.amount:
+    if result.rowcount == 0:
+        # Distinguish a missing participant from insufficient points
+        current_points = db.scalar(
+            select(Participant.total_points).where(
+                Participant.id == points_data.participant_id
+            )
+        )
+        if current_points is None:
+            raise ParticipantNotFoundError(points_data.participant_id)
         raise InsufficientPointsError(
             required_points=points_data.amount,
-            current_points=participant.total_points
+            current_points=current_points
         )
 
     # Create penalty transaction (negative amount)
@@ -108,12 +148,8 @@ def subtract_points_from_participant(
         admin_id=points_data.admin_id
     )
 
-    # Update participant points
-    participant.subtract_points(points_data.amount)
-
     db.add(transaction)
     db.commit()
-    db.refresh(transaction)
 
     log_points_transaction(
         participant_id=points_data.participant_id,
@@ -150,15 +186,13 @@ def award_challenge_points(
         ChallengeNotFoundError: If challenge not found
     """
     # Get participant
-    participant = db.query(Participant).filter(
-        Participant.id == participant_id
-    ).first()
+    participant = db.get(Participant, participant_id)
 
     if not participant:
         raise ParticipantNotFoundError(participant_id)
 
     # Get challenge
-    challenge = db.query(Challenge).filter(Challenge.id == challenge_id).first()
+    challenge = db.get(Challenge, challenge_id)
 
     if not challenge:
         from app.utils.exceptions import ChallengeNotFoundError
@@ -169,7 +203,7 @@ def award_challenge_points(
     effective_points = challenge.points * multiplier
     if multiplier > 1:
         participant.points_multiplier = 1
-        logger.info(f"Applied ×{multiplier} multiplier for participant {participant_id}: {challenge.points} → {effective_points} pts")
+        logger.info("Applied ×%s multiplier for participant %s: %s → %s pts", multiplier, participant_id, challenge.points, effective_points)
 
     # Create transaction
     transaction = PointsTransaction.create_challenge_transaction(
@@ -184,7 +218,6 @@ def award_challenge_points(
 
     db.add(transaction)
     db.commit()
-    db.refresh(transaction)
 
     log_points_transaction(
         participant_id=participant_id,
@@ -218,19 +251,21 @@ def get_participant_transactions(
         ParticipantNotFoundError: If participant not found
     """
     # Verify participant exists
-    participant = db.query(Participant).filter(
-        Participant.id == participant_id
-    ).first()
+    participant = db.get(Participant, participant_id)
 
     if not participant:
         raise ParticipantNotFoundError(participant_id)
 
-    # Get transactions ordered by most recent first
-    return db.query(PointsTransaction).filter(
-        PointsTransaction.participant_id == participant_id
-    ).order_by(
-        PointsTransaction.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    # Get transactions ordered by most recent first. lambda_stmt caches the
+    # statement construction across calls on this per-profile hot path.
+    stmt = lambda_stmt(
+        lambda: select(PointsTransaction)
+        .where(PointsTransaction.participant_id == participant_id)
+        .order_by(PointsTransaction.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return db.execute(stmt).scalars().all()
 
 
 def get_participant_points_today(db: Session, participant_id: int) -> int:
@@ -244,15 +279,16 @@ def get_participant_points_today(db: Session, participant_id: int) -> int:
     Returns:
         Total points earned today
     """
-    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    today_start = utc_today_start()
 
-    transactions = db.query(PointsTransaction).filter(
+    # Aggregate in SQL — returns one scalar instead of hydrating every row
+    return db.query(
+        func.coalesce(func.sum(PointsTransaction.amount), 0)
+    ).filter(
         PointsTransaction.participant_id == participant_id,
         PointsTransaction.created_at >= today_start,
         PointsTransaction.amount > 0  # Only positive transactions
-    ).all()
-
-    return sum(t.amount for t in transactions)
+    ).scalar()
 
 
 def get_total_points_distributed(db: Session) -> int:
@@ -265,11 +301,12 @@ def get_total_points_distributed(db: Session) -> int:
     Returns:
         Total points distributed
     """
-    transactions = db.query(PointsTransaction).filter(
+    # Aggregate in SQL — the transaction log grows all event long
+    return db.query(
+        func.coalesce(func.sum(PointsTransaction.amount), 0)
+    ).filter(
         PointsTransaction.amount > 0
-    ).all()
-
-    return sum(t.amount for t in transactions)
+    ).scalar()
 
 
 def get_transaction_count(db: Session) -> int:
@@ -14,79 +14,64 @@ from app.utils.logger import logger
 scheduler = AsyncIOScheduler()
 
 
-async def morning_pack_distribution():
+async def _run_distribution(label: str, pack_distribution: dict) -> None:
     """
-    Distribute free packs at 9:00 AM (morning).
+    Run one scheduled pack distribution inside a context-managed session.
 
-    Distribution:
-    - 2 bronze packs to all participants
+    The `with SessionLocal()` form guarantees the session is closed and any
+    open transaction rolled back even when the distribution fails mid-way,
+    so misfire replays cannot pile up half-open connections the way the old
+    manual try/finally pattern could.
 
-    This function is called automatically by the scheduler.
+    Args:
+        label: Human-readable name of the distribution (for logs)
+        pack_distribution: Dictionary mapping tier to count
     """
-    logger.info("Starting morning pack distribution (9:00 AM)")
+    logger.info("Starting %s pack distribution", label)
 
-    db = SessionLocal()
     try:
-        # Distribute 2 bronze packs to all participants
-        pack_distribution = {"bronze": 2}
-
-        count = pack_service.distribute_free_packs_to_all(db, pack_distribution)
+        with SessionLocal() as db:
+            count = pack_service.distribute_free_packs_to_all(db, pack_distribution)
 
-        logger.info(f"Morning pack distribution completed: {count} participants received {pack_distribution}")
+        logger.info("%s pack distribution completed: %s participants received %s", label.capitalize(), count, pack_distribution)
 
         # TODO: Broadcast WebSocket notification
         # await manager.broadcast({
         #     "type": "pack_distribution",
         #     "data": {
-        #         "tier": "bronze",
-        #         "count": 2,
-        #         "message": "Free packs available! 2 Bronze packs added to your inventory."
+        #         "distribution": pack_distribution,
+        #         "message": "Free packs added to your inventory!"
         #     }
         # }, connection_type="leaderboard")
 
     except Exception as e:
-        logger.error(f"Failed to distribute morning packs: {str(e)}")
+        logger.error("Failed to distribute %s packs: %s", label, str(e))
         raise
-    finally:
-        db.close()
 
 
-async def evening_pack_distribution():
+async def morning_pack_distribution():
     """
-    Distribute free packs at 6:00 PM (apéro time).
+    Distribute free packs at 9:00 AM (morning).
 
     Distribution:
-    - 1 bronze pack to all participants
-    - 1 silver pack to all participants
+    - 2 bronze packs to all participants
 
     This function is called automatically by the scheduler.
     """
-    logger.info("Starting evening pack distribution (6:00 PM - apéro)")
-
-    db = SessionLocal()
-    try:
-        # Distribute 1 bronze + 1 silver pack to all participants
-        pack_distribution = {"bronze": 1, "silver": 1}
+    await _run_distribution("morning", {"bronze": 2})
 
-        count = pack_service.distribute_free_packs_to_all(db, pack_distribution)
 
-        logger.info(f"Evening pack distribution completed: {count} participants received {pack_distribution}")
+async def evening_pack_distribution():
+    """
+    Distribute free packs at 6:00 PM (apéro time).
 
-        # TODO: Broadcast WebSocket notification
-        # await manager.broadcast({
-        #     "type": "pack_distribution",
-        #     "data": {
-        #         "tier": "mixed",
-        #         "count": 2,
-        #         "message": "Apéro time! 1 Bronze pack and 1 Silver pack added to your inventory."
-        #     }
-        # }, connection_type="leaderboard")
+    Distribution:
+    - 1 bronze pack to all participants
+    - 1 silver pack to all participants
 
-    except Exception as e:
-        logger.error(f"Failed to distribute evening packs: {str(e)}")
-        raise
-    finally:
-        db.close()
+    This function is called automatically by the scheduler.
+    """
+    await _run_distribution("evening", {"bronze": 1, "silver": 1})
 
 
 def start_scheduler():
@@ -135,7 +120,7 @@ def start_scheduler():
         logger.info("  - Evening distribution: 6:00 PM (Europe/Paris)")
 
     except Exception as e:
-        logger.error(f"Failed to start pack scheduler: {str(e)}")
+        logger.error("Failed to start pack scheduler: %s", str(e))
         raise
 
 
@@ -157,5 +142,5 @@ def shutdown_scheduler():
         else:
             logger.info("Pack scheduler was not running")
     except Exception as e:
-        logger.error(f"Error shutting down pack scheduler: {str(e)}")
+        logger.error("Error shutting down pack scheduler: %s", str(e))
         raise
@@ -30,6 +30,14 @@ class EVGException(Exception):
         self.message = message
         self.status_code = status_code
         self.detail = detail
+        # Response body built once at raise time; error handlers serialize it
+        # as-is instead of assembling a fresh dict per response
+        self.response = {
+            "success": False,
+            "error": message,
+            "detail": detail,
+            "status_code": status_code,
+        }
         super().__init__(self.message)
 
 
@@ -274,9 +282,4 @@ def format_exception_response(exc: EVGException) -> dict:
             "status_code": 404
         }
     """
-    return {
-        "success": False,
-        "error": exc.message,
-        "detail": exc.detail,
-        "status_code": exc.status_code
-    }
+    return exc.response
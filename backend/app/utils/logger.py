@@ -11,12 +11,28 @@ Features:
 - JSON formatting for production environments
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 import os
 
+# Skip per-record thread/process introspection: nothing in our format strings
+# uses %(thread)s / %(process)s / %(processName)s, so there is no point paying
+# for os.getpid() + threading.current_thread() on every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+# Set once the application logger has its QueueHandler installed. Cheaper to
+# test than re-fetching the logger and scanning its handler list on every
+# subsequent setup_logger call.
+_configured = False
+
 
 def setup_logger(
     name: str = "evg_ultimate_team",
@@ -40,9 +56,15 @@ def setup_logger(
         >>> logger = setup_logger(__name__)
         >>> logger.info("Application started", extra={"user_id": 123})
     """
+    global _configured
+
     # Create logger
     logger = logging.getLogger(name)
 
+    # Already configured: return without touching level or handlers
+    if _configured and name == "evg_ultimate_team":
+        return logger
+
     # Determine log level
     if log_level is None:
         log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -60,11 +82,16 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
+    # Real output handlers. These are NOT attached to the logger directly:
+    # they run on a background QueueListener thread so request threads never
+    # block on formatting or console/file I/O.
+    output_handlers = []
+
     # Console handler (always enabled)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(detailed_formatter)
-    logger.addHandler(console_handler)
+    output_handlers.append(console_handler)
 
     # File handler (optional)
     if log_file is None:
@@ -78,7 +105,21 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+
+    # The logger itself only does a non-blocking queue put; the listener
+    # thread drains the queue into the real handlers.
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, *output_handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    if name == "evg_ultimate_team":
+        _configured = True
 
     return logger
 
@@ -87,6 +128,25 @@ def setup_logger(
 logger = setup_logger()
 
 
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Return a named child of the application logger.
+
+    Child loggers propagate to the already-configured application logger,
+    so this never re-runs handler setup — use it from modules that want a
+    per-module logger name in their records.
+
+    Args:
+        name: Module name suffix (e.g. __name__); None for the app logger
+
+    Returns:
+        Logger instance sharing the application handlers
+    """
+    if not name:
+        return logger
+    return logger.getChild(name)
+
+
 # Convenience functions for common logging patterns
 def log_request(method: str, path: str, user_id: Optional[int] = None) -> None:
     """
@@ -97,8 +157,11 @@ def log_request(method: str, path: str, user_id: Optional[int] = None) -> None:
         path: Request path
         user_id: Optional user ID making the request
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info(
-        f"HTTP Request: {method} {path}",
+        "HTTP Request: %s %s", method, path,
         extra={"method": method, "path": path, "user_id": user_id}
     )
 
@@ -118,9 +181,12 @@ def log_points_transaction(
         reason: Reason for the transaction
         admin_id: Optional ID of admin who triggered the transaction
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     action = "added to" if amount > 0 else "subtracted from"
     logger.info(
-        f"Points {action} participant",
+        "Points %s participant", action,
         extra={
             "participant_id": participant_id,
             "points": amount,
@@ -145,8 +211,11 @@ def log_challenge_validation(
         validated_by: Admin ID who validated the challenge
         status: Validation status (completed, failed, etc.)
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info(
-        f"Challenge validation: {status}",
+        "Challenge validation: %s", status,
         extra={
             "challenge_id": challenge_id,
             "participant_ids": participant_ids,
@@ -166,12 +235,15 @@ def log_auth_attempt(username: str, success: bool, is_admin: bool = False) -> No
         is_admin: Whether this is an admin login attempt
     """
     level = logging.INFO if success else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
+
     user_type = "admin" if is_admin else "participant"
     result = "successful" if success else "failed"
 
     logger.log(
         level,
-        f"{user_type.capitalize()} login {result}",
+        "%s login %s", user_type.capitalize(), result,
         extra={
             "username": username,
             "success": success,
@@ -188,8 +260,11 @@ def log_error(error: Exception, context: Optional[dict] = None) -> None:
         error: The exception that occurred
         context: Optional dictionary with additional context
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+
     logger.error(
-        f"Error occurred: {str(error)}",
+        "Error occurred: %s", error,
         exc_info=True,
         extra=context or {}
     )
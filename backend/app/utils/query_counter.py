@@ -0,0 +1,44 @@
+"""
+Query counting utility for EVG Ultimate Team.
+
+Counts SQL statements executed against an engine, used to catch N+1 query
+regressions: tests assert that list endpoints stay at a constant number of
+queries, and the dev-only middleware surfaces the per-request count in an
+X-Query-Count response header.
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(engine):
+    """
+    Count the SQL statements executed on an engine inside the block.
+
+    The counter is engine-wide, not request-scoped, so under concurrent
+    requests the number is approximate — good enough for dev visibility and
+    for single-threaded tests, where it is exact.
+
+    Args:
+        engine: SQLAlchemy Engine to observe
+
+    Yields:
+        Dict with a "count" key, updated live as statements execute
+
+    Example:
+        >>> with count_queries(engine) as counter:
+        >>>     challenges = challenge_service.get_all_challenges(db)
+        >>> assert counter["count"] <= 1
+    """
+    counter = {"count": 0}
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter["count"] += 1
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
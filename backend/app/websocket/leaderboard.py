@@ -4,14 +4,173 @@ WebSocket handler for real-time leaderboard updates.
 Provides WebSocket endpoint for live leaderboard updates.
 """
 
+import asyncio
+import time
+from datetime import datetime
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from app.database import SessionLocal
+from app.schemas.participant import ParticipantWithRank
 from app.services import leaderboard_service
 from app.websocket.manager import manager
 from app.utils.logger import logger
-from app.utils.security import verify_token
+from app.utils.security import decode_access_token
+
+# Serializes the whole leaderboard straight to JSON bytes in one
+# pydantic-core pass — no per-entry model_dump() dicts, no second
+# json.dumps walk inside send_json
+_LEADERBOARD_ADAPTER = TypeAdapter(List[ParticipantWithRank])
+
+
+# Constant envelope fragments, encoded once at import. Building a message
+# is then pure bytes concatenation of the changed slices — no dict, no
+# envelope re-serialization, no per-message str.encode of the type tag.
+_PREFIX_INITIAL = b'{"type":"leaderboard_initial","data":'
+_PREFIX_UPDATE = b'{"type":"leaderboard_update","data":'
+
+
+def _splice_message(prefix: bytes, data_json: bytes, tail: bytes = b"}") -> str:
+    """
+    Frame an already-serialized data fragment into the message envelope.
+
+    Args:
+        prefix: One of the precomputed envelope prefixes above
+        data_json: Serialized entry list from the TypeAdapter
+        tail: Closing bytes, allowing extra pre-serialized fields
+
+    Returns:
+        Complete JSON message as text, ready for send_text
+    """
+    return (prefix + data_json + tail).decode()
+
+
+def _query_and_serialize(db: Session) -> bytes:
+    """Run the leaderboard query and dump it to JSON bytes.
+
+    Blocking (sync SQLAlchemy + pydantic-core); callers on the event loop
+    hand it to a worker thread via run_in_executor. The loop's default
+    executor is effectively dedicated to this module — FastAPI runs sync
+    route handlers on AnyIO's own thread pool, not here.
+    """
+    leaderboard = leaderboard_service.get_leaderboard(db, include_today_points=True)
+    db.rollback()
+    return _LEADERBOARD_ADAPTER.dump_json(leaderboard)
+
+
+def _fetch_and_serialize() -> bytes:
+    """Worker-thread body for the debounced flush: own session, fresh read."""
+    with SessionLocal() as db:
+        return _query_and_serialize(db)
+
+
+async def _current_data_json(db: Session) -> bytes:
+    """
+    Serialized leaderboard entry list, served from the shared TTL cache.
+
+    A fragment younger than the TTL (with no flush in flight that could be
+    about to change it) is reused as-is, so a burst of connecting sockets
+    costs one query and one serialization instead of one each. Cache misses
+    run the query in a worker thread so the event loop keeps servicing the
+    other sockets meanwhile.
+
+    Args:
+        db: Session to query on a cache miss
+
+    Returns:
+        The entry list as JSON bytes, ready for _splice_message
+    """
+    global _last_data_json, _last_data_at
+    now = time.monotonic()
+    if (
+        _last_data_json is not None
+        and now - _last_data_at < _DATA_TTL_SECONDS
+        and not _flush_pending
+    ):
+        return _last_data_json
+
+    data_json = await asyncio.get_running_loop().run_in_executor(
+        None, _query_and_serialize, db
+    )
+    _last_data_json = data_json
+    _last_data_at = time.monotonic()
+    return data_json
+
+# Broadcast debounce window. Points changes arrive in bursts (a validated
+# team challenge writes one transaction per participant); coalescing them
+# means one leaderboard query and one framed message per client instead of
+# one of each per transaction.
+_DEBOUNCE_SECONDS = 0.15
+
+# True while a flush is scheduled; only touched from the event loop
+_flush_pending = False
+
+# Server event loop, captured at startup so sync route handlers (which run
+# in the threadpool) can schedule broadcasts thread-safely
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Last broadcast snapshot: the hash of the serialized entry list (without the
+# timestamp, which changes every flush) and the full framed message it was
+# spliced into. Admin tools and client "refresh" pings regularly trigger
+# flushes where no score actually moved; comparing hashes skips the whole
+# fan-out for those, and the cached frame answers "refresh" without a query.
+_last_data_hash: Optional[int] = None
+_last_payload: Optional[str] = None
+
+# Short TTL on the serialized entry list itself, shared by every socket:
+# a reconnect storm (13 phones rejoining the same WiFi) otherwise runs one
+# identical leaderboard query per handshake. One second is far below the
+# debounce-to-flush latency a client already tolerates.
+_DATA_TTL_SECONDS = 1.0
+_last_data_json: Optional[bytes] = None
+_last_data_at: float = 0.0
+
+
+def capture_event_loop() -> None:
+    """
+    Record the running event loop for cross-thread broadcast scheduling.
+
+    Called once from the application lifespan, where the loop is running.
+    """
+    global _loop
+    _loop = asyncio.get_running_loop()
+
+
+def schedule_leaderboard_broadcast() -> None:
+    """
+    Request a debounced leaderboard broadcast from synchronous code.
+
+    Safe to call from the threadpool that runs sync route handlers: the
+    actual scheduling hops onto the event loop via call_soon_threadsafe.
+    Bursts within the debounce window still collapse into one flush.
+
+    Example:
+        >>> # In a route handler, after a points mutation commits
+        >>> schedule_leaderboard_broadcast()
+    """
+    loop = _loop
+    if loop is None or _flush_pending:
+        return
+
+    if manager.get_connection_count("leaderboard") == 0:
+        return
+
+    loop.call_soon_threadsafe(_schedule_flush)
+
+
+def _schedule_flush() -> None:
+    """Arm the debounce timer; runs on the event loop."""
+    global _flush_pending
+    if _flush_pending:
+        return
+    _flush_pending = True
+    asyncio.get_running_loop().call_later(
+        _DEBOUNCE_SECONDS,
+        lambda: asyncio.ensure_future(_flush_leaderboard_update()),
+    )
 
 
 async def leaderboard_websocket_endpoint(
@@ -56,98 +215,145 @@ async def leaderboard_websocket_endpoint(
         logger.warning("WebSocket connection rejected: missing token")
         return
 
-    try:
-        payload = verify_token(token)
-    except Exception as e:
+    # decode_access_token serves repeat verifications from its TTL cache, so
+    # a mobile reconnection storm presenting the same token does not re-run
+    # the signature check per handshake. The TTL keeps expiry honest — an
+    # lru_cache keyed on the raw token would happily serve expired tokens.
+    payload = decode_access_token(token)
+    if payload is None:
         await websocket.close(code=1008, reason="Invalid authentication token")
-        logger.warning(f"WebSocket connection rejected: invalid token - {str(e)}")
+        logger.warning("WebSocket connection rejected: invalid token")
         return
 
     # Token is valid: accept the connection.
     await websocket.accept()
-    logger.info(f"WebSocket authenticated: user_id={payload.get('user_id')}, is_admin={payload.get('is_admin')}")
+    logger.info(
+        "WebSocket authenticated: user_id=%s, is_admin=%s",
+        payload.user_id,
+        payload.is_admin,
+    )
 
     # Register the connection with the manager
-    manager.active_connections.setdefault("leaderboard", []).append(websocket)
+    manager.active_connections.setdefault("leaderboard", set()).add(websocket)
 
+    # One session for the connection's lifetime instead of a fresh
+    # SessionLocal() per message. rollback() after each use releases the
+    # pooled connection (nothing is pinned between messages) and expires
+    # the identity map, so a later refresh still reads fresh rows.
+    db = SessionLocal()
     try:
-        # Send initial leaderboard data
-        # Create a new DB session for this operation only
-        db = SessionLocal()
-        try:
-            leaderboard = leaderboard_service.get_leaderboard(db, include_today_points=True)
-            await manager.send_personal_message(
-                {
-                    "type": "leaderboard_initial",
-                    "data": [entry.model_dump() for entry in leaderboard],
-                    "message": "Connected to leaderboard updates"
-                },
-                websocket
-            )
-        finally:
-            db.close()
-
-        # Keep connection alive and handle incoming messages
+        # Send initial leaderboard data (shared TTL cache absorbs
+        # reconnect storms)
+        await websocket.send_text(_splice_message(
+            _PREFIX_INITIAL,
+            await _current_data_json(db),
+            tail=b',"message":"Connected to leaderboard updates"}',
+        ))
+
+        # Handle incoming messages. Keepalive is protocol-level PING/PONG
+        # (uvicorn's ws_ping_interval/ws_ping_timeout): the frames never
+        # surface here and browsers answer them automatically, so no
+        # Python-level string handling runs per keepalive.
+        # "refresh" is the only message type; if a second one ever lands,
+        # switch to a dict of async handlers rather than growing an
+        # if/elif chain here.
         while True:
-            # Wait for messages from client (ping/pong for connection keep-alive)
             data = await websocket.receive_text()
 
-            # Handle different message types
-            if data == "ping":
-                await websocket.send_text("pong")
-            elif data == "refresh":
-                # Client requested a leaderboard refresh
-                # Create a new DB session for this operation only
-                db = SessionLocal()
-                try:
-                    leaderboard = leaderboard_service.get_leaderboard(db, include_today_points=True)
-                    await manager.send_personal_message(
-                        {
-                            "type": "leaderboard_update",
-                            "data": [entry.model_dump() for entry in leaderboard]
-                        },
-                        websocket
+            if data == "refresh":
+                # Client requested a leaderboard refresh. Every points
+                # mutation schedules a flush, so when nothing is in flight
+                # the cached frame from the last broadcast is current —
+                # answer from it without touching the database.
+                if _last_payload is not None and not _flush_pending:
+                    await websocket.send_text(_last_payload)
+                else:
+                    # Cold cache (no broadcast yet) or a flush is pending:
+                    # fall back to the TTL-cached fragment for this socket
+                    await websocket.send_text(
+                        _splice_message(_PREFIX_UPDATE, await _current_data_json(db))
                     )
-                finally:
-                    db.close()
 
     except WebSocketDisconnect:
         manager.disconnect(websocket, "leaderboard")
         logger.info("Leaderboard WebSocket disconnected")
     except Exception as e:
-        logger.error(f"WebSocket error: {str(e)}")
+        logger.error("WebSocket error: %s", str(e))
         manager.disconnect(websocket, "leaderboard")
+    finally:
+        db.close()
 
 
-async def broadcast_leaderboard_update(db: Session):
+async def _flush_leaderboard_update():
+    """
+    Query the leaderboard once and broadcast it to every connected client.
+
+    Runs after the debounce window; opens its own short-lived session so the
+    snapshot reflects every write that landed during the window.
+    """
+    global _flush_pending, _last_data_hash, _last_payload
+    global _last_data_json, _last_data_at
+    _flush_pending = False
+
+    try:
+        # Query + serialize in a worker thread: the event loop keeps
+        # servicing every connected socket while the snapshot is built
+        data_json = await asyncio.get_running_loop().run_in_executor(
+            None, _fetch_and_serialize
+        )
+        _last_data_json = data_json
+        _last_data_at = time.monotonic()
+
+        # Hash the entry list before framing: if the standings are byte-for-
+        # byte identical to the last broadcast, every client already shows
+        # this state and the whole fan-out can be skipped
+        data_hash = hash(data_json)
+        if data_hash == _last_data_hash:
+            logger.debug("Leaderboard unchanged, broadcast skipped")
+            return
+
+        # orjson renders the datetime natively (UTC, Z-suffixed) — no
+        # Python-level isoformat call
+        timestamp = orjson.dumps(
+            datetime.utcnow(), option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+        )
+        payload = _splice_message(
+            _PREFIX_UPDATE,
+            data_json,
+            tail=b',"timestamp":' + timestamp + b"}",
+        )
+        _last_data_hash = data_hash
+        _last_payload = payload
+        await manager.broadcast_text(payload, connection_type="leaderboard")
+
+        logger.info("Broadcasted leaderboard update to all clients")
+
+    except Exception as e:
+        logger.error("Failed to broadcast leaderboard update: %s", str(e))
+
+
+async def broadcast_leaderboard_update(db: Optional[Session] = None):
     """
     Broadcast updated leaderboard to all connected clients.
 
-    This function should be called whenever points change
-    (after challenge validation, manual points adjustment, etc.)
+    This function should be called whenever points change (after challenge
+    validation, manual points adjustment, etc.). Calls within the debounce
+    window are coalesced into a single query + broadcast, so a burst of
+    transactions — e.g. a team challenge crediting 13 participants — costs
+    one flush instead of thirteen.
 
     Args:
-        db: Database session
+        db: Unused; kept for call-site compatibility. The flush reads from
+            its own session after the debounce window so it sees all writes.
 
     Example:
         >>> # After awarding points
         >>> await broadcast_leaderboard_update(db)
     """
-    from datetime import datetime
-
-    try:
-        leaderboard = leaderboard_service.get_leaderboard(db, include_today_points=True)
-
-        await manager.broadcast(
-            {
-                "type": "leaderboard_update",
-                "data": [entry.model_dump() for entry in leaderboard],
-                "timestamp": datetime.utcnow().isoformat()
-            },
-            connection_type="leaderboard"
-        )
+    if _flush_pending:
+        return
 
-        logger.info("Broadcasted leaderboard update to all clients")
+    if manager.get_connection_count("leaderboard") == 0:
+        return
 
-    except Exception as e:
-        logger.error(f"Failed to broadcast leaderboard update: {str(e)}")
+    _schedule_flush()
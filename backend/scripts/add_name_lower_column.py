@@ -0,0 +1,57 @@
+"""
+Add name_lower column to participants table.
+
+This script adds the indexed lowercase name column used for login lookups
+and backfills it from the existing name values.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def add_name_lower_column():
+    """Add name_lower column to participants table and backfill it."""
+
+    with engine.connect() as connection:
+        # Check if column already exists
+        result = connection.execute(text(
+            "PRAGMA table_info(participants)"
+        ))
+
+        columns = [row[1] for row in result]
+
+        if 'name_lower' not in columns:
+            connection.execute(text(
+                "ALTER TABLE participants ADD COLUMN name_lower VARCHAR(100)"
+            ))
+            print("[OK] Added column 'name_lower' to participants table")
+        else:
+            print("[OK] Column 'name_lower' already exists")
+
+        # Backfill from existing names (idempotent)
+        connection.execute(text(
+            "UPDATE participants SET name_lower = lower(name) "
+            "WHERE name_lower IS NULL OR name_lower != lower(name)"
+        ))
+
+        # Index the column so login lookups stay O(log n)
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_participants_name_lower "
+            "ON participants (name_lower)"
+        ))
+        connection.commit()
+
+        print("[OK] Backfilled and indexed 'name_lower'")
+
+
+if __name__ == "__main__":
+    print("Adding name_lower column to participants table...")
+    add_name_lower_column()
+    print("\nMigration completed successfully!")
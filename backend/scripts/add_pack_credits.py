@@ -17,7 +17,18 @@ from sqlalchemy import text
 
 def add_pack_credits_column():
     """Add pack_credits column to participants table."""
-    with engine.connect() as connection:
+    # WAL lets readers keep going while the migration writes, and NORMAL
+    # synchronous is durable enough under WAL while skipping an fsync per
+    # commit. journal_mode cannot change from inside a transaction, so the
+    # pragmas run on an autocommit connection first.
+    if engine.dialect.name == "sqlite":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("PRAGMA journal_mode=WAL"))
+            connection.execute(text("PRAGMA synchronous=NORMAL"))
+
+    # engine.begin() makes the ALTER + backfill one transaction: either both
+    # land or neither does, with a single commit at context exit.
+    with engine.begin() as connection:
         # Check if column already exists
         result = connection.execute(text(
             "PRAGMA table_info(participants)"
@@ -40,8 +51,6 @@ def add_pack_credits_column():
             "UPDATE participants SET pack_credits = total_points"
         ))
 
-        connection.commit()
-
         print("[OK] Added column 'pack_credits' to participants table")
         print("[OK] Initialized pack_credits = total_points for existing participants")
 
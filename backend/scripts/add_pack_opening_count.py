@@ -0,0 +1,54 @@
+"""
+Add pack_opening_count column to participants table.
+
+This script adds the denormalized pack-opening counter and backfills it
+from the existing pack_openings history, so stats displays no longer need
+a COUNT(*) per participant.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def add_pack_opening_count():
+    """Add pack_opening_count column to participants table and backfill it."""
+
+    with engine.connect() as connection:
+        # Check if column already exists
+        result = connection.execute(text(
+            "PRAGMA table_info(participants)"
+        ))
+
+        columns = [row[1] for row in result]
+
+        if 'pack_opening_count' not in columns:
+            connection.execute(text(
+                "ALTER TABLE participants ADD COLUMN pack_opening_count "
+                "INTEGER NOT NULL DEFAULT 0"
+            ))
+            print("[OK] Added column 'pack_opening_count' to participants table")
+        else:
+            print("[OK] Column 'pack_opening_count' already exists")
+
+        # Backfill from the opening history (idempotent)
+        connection.execute(text(
+            "UPDATE participants SET pack_opening_count = ("
+            "SELECT COUNT(*) FROM pack_openings "
+            "WHERE pack_openings.participant_id = participants.id)"
+        ))
+        connection.commit()
+
+        print("[OK] Backfilled 'pack_opening_count' from pack_openings")
+
+
+if __name__ == "__main__":
+    print("Adding pack_opening_count column to participants table...")
+    add_pack_opening_count()
+    print("\nMigration completed successfully!")
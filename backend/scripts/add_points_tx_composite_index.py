@@ -0,0 +1,36 @@
+"""
+Add a composite index on points_transactions (participant_id, created_at).
+
+The per-participant transaction history and the "points today" sums both
+filter on participant_id and sort/range on created_at; without a matching
+composite index the database sorts on every call.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def add_composite_index():
+    """Create the (participant_id, created_at) index on points_transactions."""
+
+    with engine.connect() as connection:
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_points_tx_participant_created "
+            "ON points_transactions (participant_id, created_at)"
+        ))
+        connection.commit()
+
+        print("[OK] Created index 'ix_points_tx_participant_created'")
+
+
+if __name__ == "__main__":
+    print("Adding composite index to points_transactions table...")
+    add_composite_index()
+    print("\nMigration completed successfully!")
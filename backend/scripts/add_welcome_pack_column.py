@@ -18,7 +18,15 @@ from app.database import engine
 def add_welcome_pack_column():
     """Add has_received_welcome_pack column to participants table."""
 
-    with engine.connect() as connection:
+    # Same pragma setup as add_pack_credits: WAL keeps readers unblocked
+    # during the migration and must be set outside a transaction.
+    if engine.dialect.name == "sqlite":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("PRAGMA journal_mode=WAL"))
+            connection.execute(text("PRAGMA synchronous=NORMAL"))
+
+    # Single transaction, committed once at context exit
+    with engine.begin() as connection:
         # Check if column already exists
         result = connection.execute(text(
             "PRAGMA table_info(participants)"
@@ -34,7 +42,6 @@ def add_welcome_pack_column():
         connection.execute(text(
             "ALTER TABLE participants ADD COLUMN has_received_welcome_pack BOOLEAN DEFAULT 0 NOT NULL"
         ))
-        connection.commit()
 
         print("[OK] Added column 'has_received_welcome_pack' to participants table")
 
@@ -0,0 +1,52 @@
+"""
+Make the name_lower index on participants unique.
+
+The lowercase name column is now the authoritative duplicate-name gate, so
+its index must be unique: create_participant relies on the database to
+reject duplicates instead of running a pre-check SELECT.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def make_name_lower_unique():
+    """Rebuild ix_participants_name_lower as a unique index."""
+
+    with engine.connect() as connection:
+        # Guard against pre-existing duplicates that would break the rebuild
+        duplicates = connection.execute(text(
+            "SELECT name_lower, COUNT(*) FROM participants "
+            "GROUP BY name_lower HAVING COUNT(*) > 1"
+        )).fetchall()
+
+        if duplicates:
+            print("[ERROR] Duplicate names found, resolve them first:")
+            for name_lower, count in duplicates:
+                print(f"  - '{name_lower}' ({count} rows)")
+            sys.exit(1)
+
+        # Rebuild the index as UNIQUE (idempotent)
+        connection.execute(text(
+            "DROP INDEX IF EXISTS ix_participants_name_lower"
+        ))
+        connection.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_participants_name_lower "
+            "ON participants (name_lower)"
+        ))
+        connection.commit()
+
+        print("[OK] Rebuilt 'ix_participants_name_lower' as a unique index")
+
+
+if __name__ == "__main__":
+    print("Making name_lower index unique on participants table...")
+    make_name_lower_unique()
+    print("\nMigration completed successfully!")
@@ -15,6 +15,8 @@ import os
 # Add parent directory to path to import app modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from sqlalchemy import func
+
 from app.database import SessionLocal
 from app.models.pack_reward import PackReward
 from app.seed import PACK_REWARDS, seed_rewards
@@ -45,9 +47,15 @@ def reseed_pack_rewards(force: bool = False) -> None:
 
         seed_rewards(db)
 
+        # One grouped SELECT for the per-tier stats instead of a COUNT
+        # query per tier
+        tier_counts = dict(
+            db.query(PackReward.tier, func.count())
+            .group_by(PackReward.tier)
+            .all()
+        )
         for tier in ("bronze", "silver", "gold", "ultimate"):
-            count = db.query(PackReward).filter(PackReward.tier == tier).count()
-            logger.info(f"  - {tier.capitalize()}: {count} rewards")
+            logger.info(f"  - {tier.capitalize()}: {tier_counts.get(tier, 0)} rewards")
     except Exception as e:
         logger.error(f"Failed to seed pack rewards: {e}")
         db.rollback()
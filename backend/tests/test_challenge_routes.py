@@ -0,0 +1,85 @@
+"""
+Route-level tests for the participant challenges endpoint.
+
+Regression coverage for GET /api/challenges/participant/{id}: the string
+backrefs on Participant are plain lists (lazy="dynamic" only applies to the
+forward attributes on Challenge), so pagination must go through the
+association tables — calling .order_by on the backref used to 500.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.database import Base, get_db
+from app.models import Challenge, ChallengeStatus, ChallengeType, Participant
+from app.models.challenge import challenge_assignments, challenge_completions
+
+
+@pytest.fixture
+def client():
+    # StaticPool shares a single in-memory connection across threads so the
+    # TestClient worker thread sees the same schema/data created here.
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+
+    session.add(Participant(name="Paul C.", is_groom=True, total_points=0,
+                            current_packs={"bronze": 0, "silver": 0, "gold": 0, "ultimate": 0}))
+    for i in range(1, 4):
+        session.add(Challenge(
+            title=f"Défi {i}",
+            description="Un défi de test",
+            type=ChallengeType.INDIVIDUAL,
+            points=30,
+            status=ChallengeStatus.PENDING,
+        ))
+    session.commit()
+
+    # Participant 1 is assigned challenges 1-3 and has completed challenge 2
+    session.execute(challenge_assignments.insert(), [
+        {"challenge_id": i, "participant_id": 1} for i in (1, 2, 3)
+    ])
+    session.execute(challenge_completions.insert(),
+                    [{"challenge_id": 2, "participant_id": 1}])
+    session.commit()
+
+    def _override_get_db():
+        try:
+            yield session
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = _override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    session.close()
+    engine.dispose()
+
+
+def test_participant_challenges_returns_assigned_and_completed(client):
+    response = client.get("/api/challenges/participant/1")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [c["id"] for c in data["assigned"]] == [1, 2, 3]
+    assert [c["id"] for c in data["completed"]] == [2]
+
+
+def test_participant_challenges_pagination(client):
+    response = client.get("/api/challenges/participant/1?skip=1&limit=1")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [c["id"] for c in data["assigned"]] == [2]
+
+
+def test_participant_challenges_unknown_participant(client):
+    response = client.get("/api/challenges/participant/999")
+    assert response.status_code == 404
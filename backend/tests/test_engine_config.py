@@ -0,0 +1,26 @@
+"""
+Regression tests for engine construction in app.database.
+
+In-memory SQLite URLs select SingletonThreadPool, which rejects the
+QueuePool sizing arguments (pool_size/max_overflow) — passing them
+unconditionally used to raise TypeError at import time for any
+sqlite:///:memory: DATABASE_URL.
+"""
+
+from sqlalchemy.pool import QueuePool
+
+from app.database import create_app_engine
+
+
+def test_in_memory_sqlite_urls_construct():
+    for url in ("sqlite://", "sqlite:///:memory:"):
+        engine = create_app_engine(url)
+        engine.dispose()
+
+
+def test_file_sqlite_engine_keeps_pool_bounds():
+    engine = create_app_engine("sqlite:////tmp/evg_engine_config_test.db")
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 10
+    assert engine.pool._max_overflow == 5
+    engine.dispose()
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+# Import models so they register on Base.metadata before create_all
+from app.models import Challenge, ChallengeStatus, ChallengeType, Participant  # noqa: F401
+from app.routes.challenges import _serialize_challenges
+from app.schemas.points import PointsAdd
+from app.services import challenge_service, leaderboard_service, points_service
+from app.utils.query_counter import count_queries
+
+
+@pytest.fixture
+def db_env():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    participants = [
+        Participant(name=f"Joueur {i}", is_groom=False, total_points=0,
+                    current_packs={"bronze": 0, "silver": 0, "gold": 0, "ultimate": 0})
+        for i in range(1, 6)
+    ]
+    session.add_all(participants)
+    challenges = [
+        Challenge(title=f"Défi {i}", description="d", type=ChallengeType.INDIVIDUAL,
+                  points=20, status=ChallengeStatus.PENDING)
+        for i in range(1, 11)
+    ]
+    session.add_all(challenges)
+    session.commit()
+    try:
+        yield engine, session, challenges
+    finally:
+        session.close()
+
+
+def test_serialize_challenges_is_constant_query(db_env):
+    # Listing and serializing N challenges must not scale queries with N:
+    # one SELECT for the list plus two IN queries over the association
+    # tables, regardless of how many rows go out.
+    engine, session, _ = db_env
+
+    with count_queries(engine) as counter:
+        challenges = challenge_service.get_all_challenges(session)
+        serialized = _serialize_challenges(session, challenges)
+
+    assert len(serialized) == 10
+    assert counter["count"] <= 3
+
+
+def test_leaderboard_with_today_points_is_single_query(db_env):
+    engine, session, _ = db_env
+    points_service.add_points_to_participant(
+        session, PointsAdd(participant_id=1, amount=30, reason="test", admin_id=1)
+    )
+
+    with count_queries(engine) as counter:
+        leaderboard = leaderboard_service.get_leaderboard(session, include_today_points=True)
+
+    assert len(leaderboard) == 5
+    assert counter["count"] <= 1